@@ -1,5 +1,8 @@
+import gzip
 import json
+import os
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -36,11 +39,92 @@ def mock_transactions() -> List[Dict[str, Any]]:
     :return: テスト用のトランザクションデータのリスト
     """
     return [
-        {"id": 1, "amount": 1000000000},
-        {"id": 2, "amount": 2000000000},
+        {"id": 1, "hash": "hash_1", "lt": "200", "amount": 1000000000},
+        {"id": 2, "hash": "hash_2", "lt": "100", "amount": 2000000000},
     ]
 
 
+# nano_to_amount のテスト
+@pytest.mark.parametrize(
+    "value, precision, expected",
+    [(1_000_000_000, 9, 1.0), (12345, 2, 123.45), (5, 20, 5e-20), (5, -1, 50.0)],
+)
+def test_nano_to_amount(value: int, precision: int, expected: float) -> None:
+    """
+    nano_to_amount関数のテスト。
+
+    負の精度が事前計算テーブルの末尾から参照されず、10**precisionで割られることを確認する。
+
+    :param value: nanoton単位の値
+    :param precision: 小数点以下の桁数
+    :param expected: 期待される変換結果
+    """
+    assert get_ton_txns_api.nano_to_amount(value, precision) == pytest.approx(expected)
+
+
+# nano_to_amount_checked のテスト
+@pytest.mark.parametrize(
+    "value, precision, expected",
+    [(1_000_000_000, 9, 1.0), (12345, 2, 123.45), (5, 20, 5e-20)],
+)
+def test_nano_to_amount_checked(value: int, precision: int, expected: float) -> None:
+    """
+    nano_to_amount_checked関数のテスト。
+
+    :param value: nanoton単位の値
+    :param precision: 小数点以下の桁数
+    :param expected: 期待される変換結果
+    """
+    assert get_ton_txns_api.nano_to_amount_checked(value, precision) == expected
+
+
+@pytest.mark.parametrize("value, precision", [(-1, 9), (1, -1), ("1", 9)])
+def test_nano_to_amount_checked_invalid(value: Any, precision: Any) -> None:
+    """
+    nano_to_amount_checked関数の不正な入力に対するテスト。
+
+    :param value: nanoton単位の値
+    :param precision: 小数点以下の桁数
+    """
+    with pytest.raises(ValueError):
+        get_ton_txns_api.nano_to_amount_checked(value, precision)
+
+
+# nano_to_amount_decimal のテスト
+@pytest.mark.parametrize(
+    "value, precision, expected",
+    [
+        (1_000_000_000, 9, Decimal("1")),
+        (1_234_567_890_123_456_789, 9, Decimal("1234567890.123456789")),
+        (0, 9, Decimal("0")),
+        (12345, 2, Decimal("123.45")),
+    ],
+)
+def test_nano_to_amount_decimal(value: int, precision: int, expected: Decimal) -> None:
+    """
+    nano_to_amount_decimal関数のテスト。
+
+    浮動小数点の丸め誤差なしに変換されることを確認する。
+
+    :param value: nanoton単位の値
+    :param precision: 小数点以下の桁数
+    :param expected: 期待される変換結果
+    """
+    assert get_ton_txns_api.nano_to_amount_decimal(value, precision) == expected
+
+
+@pytest.mark.parametrize("value, precision", [(-1, 9), (1, -1), ("1", 9)])
+def test_nano_to_amount_decimal_invalid(value: Any, precision: Any) -> None:
+    """
+    nano_to_amount_decimal関数の不正な入力に対するテスト。
+
+    :param value: nanoton単位の値
+    :param precision: 小数点以下の桁数
+    """
+    with pytest.raises(ValueError):
+        get_ton_txns_api.nano_to_amount_decimal(value, precision)
+
+
 # save_json_file のテスト
 def test_save_json_file(
     tmp_path: Path,
@@ -56,9 +140,9 @@ def test_save_json_file(
     :param mock_transactions: モックされたトランザクションデータ
     :param monkeypatch: pytestのmonkeypatchフィクスチャ
     """
-    monkeypatch.setattr(get_ton_txns_api, "project_root", tmp_path)
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
     output_dir.mkdir(parents=True)
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", output_dir)
 
     filename = "test.json"
     get_ton_txns_api.save_json_file(mock_transactions, filename)
@@ -85,9 +169,9 @@ def test_save_json_file_overwrite_accepted(
     :param mock_transactions: モックされたトランザクションデータ
     :param monkeypatch: pytestのmonkeypatchフィクスチャ
     """
-    monkeypatch.setattr(get_ton_txns_api, "project_root", tmp_path)
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
     output_dir.mkdir(parents=True)
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", output_dir)
 
     filename = "test.json"
     (output_dir / filename).write_text("existing content")
@@ -119,9 +203,9 @@ def test_save_json_file_overwrite_denied(
     :param mock_transactions: モックされたトランザクションデータ
     :param monkeypatch: pytestのmonkeypatchフィクスチャ
     """
-    monkeypatch.setattr(get_ton_txns_api, "project_root", tmp_path)
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
     output_dir.mkdir(parents=True)
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", output_dir)
 
     filename = "test.json"
     (output_dir / filename).write_text("existing content")
@@ -154,9 +238,9 @@ def test_save_json_file_overwrite_denied_exit(
     :param mock_transactions: モックされたトランザクションデータ
     :param monkeypatch: pytestのmonkeypatchフィクスチャ
     """
-    monkeypatch.setattr(get_ton_txns_api, "project_root", tmp_path)
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
     output_dir.mkdir(parents=True)
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", output_dir)
 
     filename = "test.json"
     (output_dir / filename).write_text("existing content")
@@ -178,6 +262,172 @@ def test_save_json_file_overwrite_denied_exit(
     assert saved_data == "existing content"
 
 
+def test_save_json_file_gzip(
+    tmp_path: Path,
+    mock_transactions: List[Dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    save_json_file関数のgzip圧縮保存テスト。
+
+    ファイル名が.gzで終わる場合にgzip圧縮されたJSONが保存されることを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param mock_transactions: モックされたトランザクションデータ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", tmp_path)
+
+    get_ton_txns_api.save_json_file(mock_transactions, "test.json.gz")
+
+    with gzip.open(tmp_path / "test.json.gz", "rt", encoding="utf-8") as f:
+        saved_data = json.load(f)
+    assert saved_data == mock_transactions
+
+
+@pytest.mark.parametrize("filename", ["test.ndjson", "test.ndjson.gz"])
+def test_save_json_file_ndjson(
+    tmp_path: Path,
+    mock_transactions: List[Dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+    filename: str,
+) -> None:
+    """
+    save_json_file関数のNDJSON保存テスト。
+
+    ファイル名が.ndjson(.gz)で終わる場合に1行1トランザクションで保存されることを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param mock_transactions: モックされたトランザクションデータ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    :param filename: 保存するファイル名
+    """
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", tmp_path)
+
+    get_ton_txns_api.save_json_file(mock_transactions, filename)
+
+    saved_file = tmp_path / filename
+    if filename.endswith(".gz"):
+        content = gzip.decompress(saved_file.read_bytes()).decode("utf-8")
+    else:
+        content = saved_file.read_text(encoding="utf-8")
+    assert [json.loads(line) for line in content.splitlines()] == mock_transactions
+
+
+@freeze_time("2024-08-14")
+def test_find_saved_transactions_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    find_saved_transactions_file関数のテスト。
+
+    同じアカウント・期間で当日保存されたファイルのうち最新のものが返され、
+    当日のファイルがない場合はNoneが返されることを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", tmp_path)
+    start, end = datetime(2024, 7, 15), datetime(2024, 8, 14)
+    stem = "all_txns_tonindex_v3_EQtest_20240715-20240814"
+    assert get_ton_txns_api.find_saved_transactions_file("EQtest", start, end) is None
+
+    (tmp_path / f"{stem}_N=1_2024-08-13.json").write_text("[]")
+    older = tmp_path / f"{stem}_N=1_2024-08-14.json"
+    newer = tmp_path / f"{stem}_N=2_2024-08-14.ndjson.gz"
+    older.write_text("[]")
+    newer.write_text("")
+    os.utime(older, (1, 1))
+    (tmp_path / f"{stem}_N=3_2024-08-14.csv").write_text("")
+
+    assert get_ton_txns_api.find_saved_transactions_file("EQtest", start, end) == newer
+
+
+@freeze_time("2024-08-14")
+@pytest.mark.parametrize(
+    "account, start, end",
+    [
+        ("EQother", datetime(2024, 7, 15), datetime(2024, 8, 14)),
+        ("EQtest", datetime(2024, 8, 7), datetime(2024, 8, 14)),
+        ("EQtest", None, None),
+    ],
+)
+def test_find_saved_transactions_file_mismatch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    account: str,
+    start: Any,
+    end: Any,
+) -> None:
+    """
+    find_saved_transactions_file関数の不一致テスト。
+
+    当日保存されたファイルでも、アカウントまたは期間が異なる場合は
+    再利用されないことを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    :param account: 検索するアカウント
+    :param start: 検索する期間の開始日時
+    :param end: 検索する期間の終了日時
+    """
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", tmp_path)
+    (
+        tmp_path / "all_txns_tonindex_v3_EQtest_20240715-20240814_N=2_2024-08-14.json"
+    ).write_text("[]")
+
+    assert get_ton_txns_api.find_saved_transactions_file(account, start, end) is None
+
+
+@pytest.mark.parametrize(
+    "filename", ["test.json", "test.json.gz", "test.ndjson", "test.ndjson.gz"]
+)
+def test_load_json_file(
+    tmp_path: Path,
+    mock_transactions: List[Dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+    filename: str,
+) -> None:
+    """
+    load_json_file関数のテスト。
+
+    save_json_file関数で保存したファイルを読み込めることを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param mock_transactions: モックされたトランザクションデータ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    :param filename: 保存するファイル名
+    """
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", tmp_path)
+    get_ton_txns_api.save_json_file(mock_transactions, filename)
+
+    assert get_ton_txns_api.load_json_file(tmp_path / filename) == mock_transactions
+
+
+def test_save_json_file_creates_output_dir(
+    tmp_path: Path,
+    mock_transactions: List[Dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    save_json_file関数の出力ディレクトリ作成テスト。
+
+    出力ディレクトリが存在しない場合に作成されることを確認する。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param mock_transactions: モックされたトランザクションデータ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    output_dir = tmp_path / "output"
+    monkeypatch.setattr(get_ton_txns_api, "OUTPUT_DIR", output_dir)
+
+    get_ton_txns_api.save_json_file(mock_transactions, "first.json")
+    get_ton_txns_api.save_json_file(mock_transactions, "second.json")
+
+    assert (output_dir / "first.json").exists()
+    assert (output_dir / "second.json").exists()
+
+
 # get_transactions_v3 のテスト
 @freeze_time("2024-01-01")
 @pytest.mark.parametrize("save_json", [True, False])
@@ -193,10 +443,10 @@ def test_get_transactions_v3(
     :param mock_transactions: モックされたトランザクションデータ
     :param save_json: JSONファイル保存フラグ
     """
-    mock_response = mocker.Mock()
+    mock_response = mocker.Mock(headers={})
     mock_response.json.return_value = {"transactions": mock_transactions}
     mocker.patch(
-        "ton_txns_data_conv.account.get_ton_txns_api.requests.get",
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
         return_value=mock_response,
     )
 
@@ -214,6 +464,10 @@ def test_get_transactions_v3(
     assert result == mock_transactions
     if save_json:
         mock_save_json.assert_called_once()
+        filename = mock_save_json.call_args.args[1]
+        assert filename.startswith(
+            "all_txns_tonindex_v3_test_account_20231201-20240101_N=2_"
+        )
     else:
         mock_save_json.assert_not_called()
 
@@ -227,12 +481,18 @@ def test_get_transactions_v3_multiple_calls(mocker: MockerFixture) -> None:
     :param mocker: pytest-mockのMockerFixture
     """
     mock_responses = [
-        mocker.Mock(json=lambda: {"transactions": [{"id": 1}]}),
-        mocker.Mock(json=lambda: {"transactions": [{"id": 2}]}),
-        mocker.Mock(json=lambda: {"transactions": []}),
+        mocker.Mock(
+            headers={},
+            json=lambda: {"transactions": [{"id": 1, "hash": "a", "lt": "20"}]},
+        ),
+        mocker.Mock(
+            headers={},
+            json=lambda: {"transactions": [{"id": 2, "hash": "b", "lt": "10"}]},
+        ),
+        mocker.Mock(headers={}, json=lambda: {"transactions": []}),
     ]
     mocker.patch(
-        "ton_txns_data_conv.account.get_ton_txns_api.requests.get",
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
         side_effect=mock_responses,
     )
 
@@ -243,6 +503,183 @@ def test_get_transactions_v3_multiple_calls(mocker: MockerFixture) -> None:
     assert result[1]["id"] == 2
 
 
+def test_get_transactions_v3_keyset_cursor(mocker: MockerFixture) -> None:
+    """
+    get_transactions_v3関数のキーセットページネーションテスト。
+
+    2ページ目以降はoffsetではなく直前ページ最後のlt-1をend_ltとして指定し、
+    全ページのトランザクションが順に結合されることを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    mock_responses = [
+        mocker.Mock(
+            headers={},
+            json=lambda: {
+                "transactions": [
+                    {"id": 1, "hash": "a", "lt": "30"},
+                    {"id": 2, "hash": "b", "lt": "20"},
+                ]
+            },
+        ),
+        mocker.Mock(
+            headers={},
+            json=lambda: {
+                "transactions": [
+                    {"id": 3, "hash": "c", "lt": "10"},
+                    {"id": 4, "hash": "d", "lt": "5"},
+                ]
+            },
+        ),
+        mocker.Mock(headers={}, json=lambda: {"transactions": []}),
+    ]
+    mock_get = mocker.patch(
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
+        side_effect=mock_responses,
+    )
+
+    result = get_ton_txns_api.get_transactions_v3("test_account", limit=2)
+
+    assert [tx["id"] for tx in result] == [1, 2, 3, 4]
+    first_params = mock_get.call_args_list[0].kwargs["params"]
+    second_params = mock_get.call_args_list[1].kwargs["params"]
+    assert "offset" not in first_params
+    assert "end_lt" not in first_params
+    assert "offset" not in second_params
+    assert second_params["end_lt"] == 19
+
+
+def test_get_transactions_v3_offset_deprecated(mocker: MockerFixture) -> None:
+    """
+    get_transactions_v3関数の非推奨offset引数のテスト。
+
+    offsetを指定するとDeprecationWarningが発生し、APIにはoffsetを送らず、
+    取得結果の先頭からoffset件がスキップされることを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    mock_response = mocker.Mock(headers={})
+    mock_response.json.return_value = {
+        "transactions": [{"id": i, "hash": str(i), "lt": str(10 - i)} for i in range(3)]
+    }
+    mock_get = mocker.patch(
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
+        return_value=mock_response,
+    )
+
+    with pytest.warns(DeprecationWarning, match="offset"):
+        result = get_ton_txns_api.get_transactions_v3("test_account", offset=1)
+
+    assert [tx["id"] for tx in result] == [1, 2]
+    assert "offset" not in mock_get.call_args.kwargs["params"]
+
+
+@pytest.mark.parametrize(
+    "start_utime, end_utime, parts, expected",
+    [
+        (0, 99, 1, [(0, 99)]),
+        (0, 99, 4, [(0, 24), (25, 49), (50, 74), (75, 99)]),
+        (10, 12, 5, [(10, 10), (11, 11), (12, 12)]),
+    ],
+)
+def test_split_time_window(
+    start_utime: int,
+    end_utime: int,
+    parts: int,
+    expected: List[Any],
+) -> None:
+    """
+    _split_time_window関数のテスト。
+
+    区間が重複・欠落なく分割されることを確認する。
+
+    :param start_utime: 開始時刻(Unix時間)
+    :param end_utime: 終了時刻(Unix時間)
+    :param parts: 分割数
+    :param expected: 期待される分割結果
+    """
+    assert (
+        get_ton_txns_api._split_time_window(start_utime, end_utime, parts) == expected
+    )
+
+
+def test_get_transactions_v3_concurrent_windows(mocker: MockerFixture) -> None:
+    """
+    get_transactions_v3関数の並行取得テスト。
+
+    max_workersを指定した場合に期間が分割されて並行取得され、
+    結果が重複除去のうえltの降順に並ぶことを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    window_transactions = {
+        1700000000: [{"hash": "a", "lt": "10"}],
+        1700000050: [{"hash": "b", "lt": "30"}, {"hash": "a", "lt": "10"}],
+    }
+
+    def fake_get(url: str, params: Dict[str, Any]) -> Any:
+        return mocker.Mock(
+            headers={},
+            json=lambda: {"transactions": window_transactions[params["start_utime"]]},
+        )
+
+    mock_get = mocker.patch(
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
+        side_effect=fake_get,
+    )
+
+    result = get_ton_txns_api.get_transactions_v3(
+        "test_account",
+        datetime.fromtimestamp(1700000000),
+        datetime.fromtimestamp(1700000099),
+        max_workers=2,
+    )
+
+    assert [tx["hash"] for tx in result] == ["b", "a"]
+    requested = sorted(
+        (call.kwargs["params"]["start_utime"], call.kwargs["params"]["end_utime"])
+        for call in mock_get.call_args_list
+    )
+    assert requested == [(1700000000, 1700000049), (1700000050, 1700000099)]
+
+
+def test_get_transactions_v3_max_workers_clamped(mocker: MockerFixture) -> None:
+    """
+    get_transactions_v3関数のmax_workers上限テスト。
+
+    接続プールのサイズを超えるmax_workersが指定された場合、
+    分割数が_POOL_MAXSIZEに制限されることを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    mock_response = mocker.Mock(headers={})
+    mock_response.json.return_value = {"transactions": []}
+    mock_get = mocker.patch(
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
+        return_value=mock_response,
+    )
+
+    get_ton_txns_api.get_transactions_v3(
+        "test_account",
+        datetime.fromtimestamp(1700000000),
+        datetime.fromtimestamp(1700000999),
+        max_workers=100,
+    )
+
+    assert mock_get.call_count == get_ton_txns_api._POOL_MAXSIZE
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_get_transactions_v3_invalid_max_workers(max_workers: int) -> None:
+    """
+    get_transactions_v3関数の不正なmax_workersに対するテスト。
+
+    :param max_workers: 並行取得数
+    """
+    with pytest.raises(ValueError):
+        get_ton_txns_api.get_transactions_v3("test_account", max_workers=max_workers)
+
+
 def test_get_transactions_v3_empty_response(mocker: MockerFixture) -> None:
     """
     get_transactions_v3関数の空レスポンステスト。
@@ -251,10 +688,10 @@ def test_get_transactions_v3_empty_response(mocker: MockerFixture) -> None:
 
     :param mocker: pytest-mockのMockerFixture
     """
-    mock_response = mocker.Mock()
+    mock_response = mocker.Mock(headers={})
     mock_response.json.return_value = {"transactions": []}
     mocker.patch(
-        "ton_txns_data_conv.account.get_ton_txns_api.requests.get",
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
         return_value=mock_response,
     )
 
@@ -272,7 +709,7 @@ def test_get_transactions_v3_request_exception(mocker: MockerFixture) -> None:
     :param mocker: pytest-mockのMockerFixture
     """
     mocker.patch(
-        "ton_txns_data_conv.account.get_ton_txns_api.requests.get",
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
         side_effect=requests.exceptions.RequestException,
     )
 
@@ -289,10 +726,10 @@ def test_get_transactions_v3_json_decode_error(mocker: MockerFixture) -> None:
 
     :param mocker: pytest-mockのMockerFixture
     """
-    mock_response = mocker.Mock()
+    mock_response = mocker.Mock(headers={})
     mock_response.json.side_effect = json.JSONDecodeError("Test error", "", 0)
     mocker.patch(
-        "ton_txns_data_conv.account.get_ton_txns_api.requests.get",
+        "ton_txns_data_conv.account.get_ton_txns_api.requests.Session.get",
         return_value=mock_response,
     )
 
@@ -301,6 +738,93 @@ def test_get_transactions_v3_json_decode_error(mocker: MockerFixture) -> None:
     assert result == []
 
 
+@pytest.mark.parametrize(
+    "headers, expected_sleep",
+    [
+        ({}, None),
+        ({"x-ratelimit-remaining": "5"}, None),
+        ({"x-ratelimit-remaining": "0"}, 1.0),
+        ({"x-ratelimit-remaining": "0", "Retry-After": "3"}, 3.0),
+        ({"x-ratelimit-remaining": "0", "Retry-After": "soon"}, 1.0),
+    ],
+)
+def test_wait_for_rate_limit(
+    mocker: MockerFixture, headers: Dict[str, str], expected_sleep: Any
+) -> None:
+    """
+    _wait_for_rate_limit関数のテスト。
+
+    レート制限の残り回数が閾値を下回った場合のみ待機することを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param headers: レスポンスヘッダー
+    :param expected_sleep: 期待される待機秒数（待機しない場合はNone）
+    """
+    mock_sleep = mocker.patch("ton_txns_data_conv.account.get_ton_txns_api.time.sleep")
+
+    get_ton_txns_api._wait_for_rate_limit(mocker.Mock(headers=headers))
+
+    if expected_sleep is None:
+        mock_sleep.assert_not_called()
+    else:
+        mock_sleep.assert_called_once_with(expected_sleep)
+
+
+@freeze_time("2024-08-14 00:00:00")
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, 1.0),
+        ("2.5", 2.5),
+        ("-5", 0.0),
+        ("3600", 60.0),
+        ("nan", 1.0),
+        ("Wed, 14 Aug 2024 00:00:10 GMT", 10.0),
+        ("Tue, 13 Aug 2024 23:59:00 GMT", 0.0),
+        ("not a date", 1.0),
+    ],
+)
+def test_retry_after_seconds(value: Any, expected: float) -> None:
+    """
+    _retry_after_seconds関数のテスト。
+
+    秒数形式とHTTP-date形式のRetry-Afterを解釈し、不正値は既定値、
+    負値は0、過大な値は上限に丸められることを確認する。
+
+    :param value: Retry-Afterヘッダーの値
+    :param expected: 期待される待機秒数
+    """
+    assert get_ton_txns_api._retry_after_seconds(value) == expected
+
+
+def test_create_session_retries_throttled_requests() -> None:
+    """
+    create_session関数のテスト。
+
+    429および5xxを指数バックオフでリトライするアダプタが設定されていることを確認する。
+    """
+    session = get_ton_txns_api.create_session()
+    retry = session.get_adapter("https://toncenter.com").max_retries
+
+    assert retry.total == 5
+    assert 429 in retry.status_forcelist
+    assert retry.respect_retry_after_header is True
+    assert session.headers["accept"] == "application/json"
+    session.close()
+
+
+def test_get_session_is_shared() -> None:
+    """
+    _get_session関数のテスト。
+
+    接続を再利用するため、同一のセッションが返されることを確認する。
+    """
+    session = get_ton_txns_api._get_session()
+
+    assert get_ton_txns_api._get_session() is session
+    assert session.get_adapter("https://tonapi.io")._pool_maxsize == 8
+
+
 def test_main(
     mocker: MockerFixture,
     mock_config: Dict[str, Any],
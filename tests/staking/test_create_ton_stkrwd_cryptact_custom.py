@@ -1,4 +1,7 @@
 import datetime
+import gzip
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -149,6 +152,7 @@ def test_create_cryptact_custom_data(sample_transaction: Dict[str, Any]) -> None
 
     result = create_cryptact_custom_data(sample_transaction)
     assert result is not None, "Result should not be None"
+    assert isinstance(result, list)
 
     print(f"Result: {result}")
 
@@ -175,6 +179,59 @@ def test_create_cryptact_custom_data(sample_transaction: Dict[str, Any]) -> None
     ), f"Expected {expected_utc_str}, but got {result_utc[0]}"
 
 
+def test_create_cryptact_custom_data_tzinfo(
+    sample_transaction: Dict[str, Any],
+) -> None:
+    """
+    create_cryptact_custom_data 関数にタイムゾーン名の代わりにtzinfoを渡した場合のテスト。
+
+    :param sample_transaction: サンプルのトランザクションデータ
+    """
+    tz = pytz.timezone("Asia/Tokyo")
+    assert create_cryptact_custom_data(
+        sample_transaction, transaction_timezone=tz
+    ) == create_cryptact_custom_data(sample_transaction, "Asia/Tokyo")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1", "0.000000001"),
+        ("1000000000", "1.000000000"),
+        ("123456789012345678", "123456789.012345678"),
+    ],
+)
+def test_create_cryptact_custom_data_volume(
+    sample_transaction: Dict[str, Any], value: str, expected: str
+) -> None:
+    """
+    create_cryptact_custom_data 関数のVolumeが丸め誤差なく出力されることのテスト。
+
+    :param sample_transaction: サンプルのトランザクションデータ
+    :param value: nanoton単位の取引額
+    :param expected: 期待されるVolume
+    """
+    transaction = {**sample_transaction, "in_msg": {"value": value}}
+    result = create_cryptact_custom_data(transaction)
+    assert result is not None
+    assert result[4] == expected
+
+
+def test_create_cryptact_custom_data_negative_value(
+    sample_transaction: Dict[str, Any],
+) -> None:
+    """
+    create_cryptact_custom_data 関数に負の取引額を渡した場合のテスト。
+
+    誤ったVolumeを出力せず、ValueErrorが発生することを確認する。
+
+    :param sample_transaction: サンプルのトランザクションデータ
+    """
+    transaction = {**sample_transaction, "in_msg": {"value": "-5"}}
+    with pytest.raises(ValueError, match="positive integer"):
+        create_cryptact_custom_data(transaction)
+
+
 def test_create_cryptact_custom_data_invalid(
     sample_transaction: Dict[str, Any],
 ) -> None:
@@ -207,8 +264,8 @@ def test_create_cryptact_custom_csv(
     """
     mocker.patch("builtins.input", return_value="y")
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -235,6 +292,129 @@ def test_create_cryptact_custom_csv(
     ]
 
 
+@freeze_time("2024-08-14")
+def test_create_cryptact_custom_csv_content(
+    sample_transactions: List[Dict[str, Any]], mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """
+    create_cryptact_custom_csv 関数の出力内容のテスト。
+
+    CSVの各行が create_cryptact_custom_data の結果と一致し、
+    取引額が0のトランザクションが除外されることを確認する。
+
+    :param sample_transactions: サンプルのトランザクションリスト
+    :param mocker: pytest mocker fixture
+    :param tmp_path: 一時ディレクトリのパス
+    """
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
+    )
+    output_dir = tmp_path / "ton_txns_data_conv" / "output"
+    output_dir.mkdir(parents=True)
+
+    zero_value_transaction = {
+        "hash": "test_hash_0",
+        "now": 1628000000,
+        "in_msg": {"value": "0"},
+    }
+    no_in_msg_transaction = {"hash": "test_hash_x", "now": 1628000000}
+    create_cryptact_custom_csv(
+        [
+            sample_transactions[1],
+            zero_value_transaction,
+            no_in_msg_transaction,
+            sample_transactions[0],
+        ]
+    )
+
+    df = pd.read_csv(
+        output_dir / "transactions_tonindex_v3_N=2_2024-08-14.csv",
+        dtype=str,
+        keep_default_na=False,
+    )
+    expected = [create_cryptact_custom_data(t) for t in sample_transactions]
+    assert df.values.tolist() == [[str(v) for v in row] for row in expected]
+
+
+@freeze_time("2024-08-14")
+def test_create_cryptact_custom_csv_descending(
+    sample_transactions: List[Dict[str, Any]], mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """
+    ascending=False の場合に新しい順で出力されることのテスト。
+
+    :param sample_transactions: サンプルのトランザクションリスト
+    :param mocker: pytest mocker fixture
+    :param tmp_path: 一時ディレクトリのパス
+    """
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
+    )
+    output_dir = tmp_path / "ton_txns_data_conv" / "output"
+    output_dir.mkdir(parents=True)
+
+    create_cryptact_custom_csv(sample_transactions, ascending=False)
+
+    df = pd.read_csv(output_dir / "transactions_tonindex_v3_N=2_2024-08-14.csv")
+    assert df["Timestamp"].tolist() == sorted(df["Timestamp"], reverse=True)
+
+
+@freeze_time("2024-08-14")
+def test_create_cryptact_custom_csv_sorted_across_dst_fall_back(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """
+    夏時間終了で現地時刻が重複する場合でも時系列順に出力されることのテスト。
+
+    :param mocker: pytest mocker fixture
+    :param tmp_path: 一時ディレクトリのパス
+    """
+    output_dir = tmp_path / "ton_txns_data_conv" / "output"
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        output_dir,
+    )
+    output_dir.mkdir(parents=True)
+
+    # 2023-11-05 01:30 EDT (05:30 UTC) と 01:10 EST (06:10 UTC)
+    transactions = [
+        {"hash": "est", "now": 1699164600, "in_msg": {"value": "1"}},
+        {"hash": "edt", "now": 1699162200, "in_msg": {"value": "1"}},
+    ]
+    create_cryptact_custom_csv(transactions, transaction_timezone="America/New_York")
+
+    df = pd.read_csv(output_dir / "transactions_tonindex_v3_N=2_2024-08-14.csv")
+    assert df["Comment"].tolist() == ["TON_TXN_HASH: edt", "TON_TXN_HASH: est"]
+
+
+@freeze_time("2024-08-14")
+def test_create_cryptact_custom_csv_compress(
+    sample_transactions: List[Dict[str, Any]], mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """
+    compress=True の場合にgzip圧縮されたCSVが出力されることのテスト。
+
+    :param sample_transactions: サンプルのトランザクションリスト
+    :param mocker: pytest mocker fixture
+    :param tmp_path: 一時ディレクトリのパス
+    """
+    output_dir = tmp_path / "ton_txns_data_conv" / "output"
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        output_dir,
+    )
+    output_dir.mkdir(parents=True)
+
+    create_cryptact_custom_csv(sample_transactions)
+    create_cryptact_custom_csv(sample_transactions, compress=True)
+
+    plain_file = output_dir / "transactions_tonindex_v3_N=2_2024-08-14.csv"
+    gz_file = output_dir / "transactions_tonindex_v3_N=2_2024-08-14.csv.gz"
+    assert gzip.decompress(gz_file.read_bytes()) == plain_file.read_bytes()
+
+
 def test_create_cryptact_custom_csv_no_transactions(mocker: MockerFixture) -> None:
     """
     トランザクションがない場合の create_cryptact_custom_csv 関数のテスト。
@@ -260,8 +440,8 @@ def test_create_cryptact_custom_csv_with_filename(
     :param tmp_path: 一時ディレクトリのパス
     """
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -286,8 +466,8 @@ def test_create_cryptact_custom_csv_default_filename(
     :param tmp_path: 一時ディレクトリのパス
     """
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -311,8 +491,8 @@ def test_create_cryptact_custom_csv_empty_filename(
     :param tmp_path: 一時ディレクトリのパス
     """
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -337,8 +517,8 @@ def test_create_cryptact_custom_csv_file_exists_overwrite(
     """
     mocker.patch("builtins.input", return_value="y")  # ユーザーが上書きを承認
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -368,8 +548,8 @@ def test_create_cryptact_custom_csv_file_exists_no_overwrite(
     """
     mocker.patch("builtins.input", return_value="n")  # ユーザーが上書きを拒否
     mocker.patch(
-        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.project_root",
-        tmp_path,
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.OUTPUT_DIR",
+        tmp_path / "ton_txns_data_conv" / "output",
     )
 
     output_dir = tmp_path / "ton_txns_data_conv" / "output"
@@ -432,6 +612,10 @@ def test_main(mocker: MockerFixture) -> None:
         return_value=mock_config,
     )
 
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.find_saved_transactions_file",
+        return_value=None,
+    )
     mock_get_transactions = mocker.patch(
         "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.get_transactions_v3"
     )
@@ -472,3 +656,77 @@ def test_main_save_csv_false(
 
     mock_get_transactions.assert_not_called()
     mock_create_csv.assert_not_called()
+
+
+@pytest.mark.parametrize("refresh", [False, True])
+def test_main_reuses_saved_json(
+    mocker: MockerFixture,
+    mock_config: Dict[str, Any],
+    sample_transactions: List[Dict[str, Any]],
+    tmp_path: Path,
+    refresh: bool,
+) -> None:
+    """
+    当日保存済みのJSONファイルがある場合の main 関数のテスト。
+
+    refresh=False の場合はAPIを呼び出さずに保存済みファイルを読み込み、
+    refresh=True の場合は保存済みファイルがあってもAPIから取得することを確認する。
+
+    :param mocker: pytest mocker fixture
+    :param mock_config: モックの設定
+    :param sample_transactions: サンプルのトランザクションリスト
+    :param tmp_path: 一時ディレクトリのパス
+    :param refresh: 再取得フラグ
+    """
+    saved_file = tmp_path / "all_txns_tonindex_v3_N=2_2024-08-14.json"
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.load_config",
+        return_value=mock_config,
+    )
+    mock_find_saved = mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.find_saved_transactions_file",
+        return_value=saved_file,
+    )
+    mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.load_json_file",
+        return_value=sample_transactions,
+    )
+    mock_get_transactions = mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.get_transactions_v3",
+        return_value=[],
+    )
+    mock_create_csv = mocker.patch(
+        "ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom.create_cryptact_custom_csv"
+    )
+
+    main(refresh=refresh)
+
+    if refresh:
+        mock_get_transactions.assert_called_once()
+        mock_create_csv.assert_called_once_with([])
+    else:
+        mock_get_transactions.assert_not_called()
+        mock_create_csv.assert_called_once_with(sample_transactions)
+        account, start_time, end_time = mock_find_saved.call_args.args
+        assert account == mock_config["ton_info"]["user_friendly_address"]
+        assert (end_time - start_time).days == mock_config["ton_info"][
+            "transaction_history_period"
+        ]
+
+
+def test_module_does_not_import_pandas() -> None:
+    """
+    create_ton_stkrwd_cryptact_custom モジュールがpandasをインポートしないことのテスト。
+
+    CSV出力は標準ライブラリのcsvモジュールで行うため、
+    CLI起動時にpandasのインポートコストが発生しないことを確認する。
+    """
+    code = (
+        "import sys; "
+        "import ton_txns_data_conv.staking.create_ton_stkrwd_cryptact_custom; "
+        "sys.exit('pandas' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[2]
+    )
+    assert result.returncode == 0
@@ -0,0 +1,366 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from aiohttp import ClientResponse, ClientSession
+from pytest_mock import MockerFixture
+
+from ton_txns_data_conv.staking import ton_whales_staking_dashboard as dashboard
+from ton_txns_data_conv.utils.output_dir import OUTPUT_DIR
+
+
+@pytest.fixture
+def cache_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    ブロック情報のキャッシュを一時ディレクトリに切り替えるフィクスチャ。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    :return: キャッシュファイルを置く一時ディレクトリパス
+    """
+    monkeypatch.setattr(dashboard, "_caches", {})
+    monkeypatch.setattr(dashboard, "_SEQNO_CACHE_PATH", tmp_path / ".seqno_cache.json")
+    monkeypatch.setattr(
+        dashboard, "_STAKING_INFO_CACHE_PATH", tmp_path / ".staking_info_cache.json"
+    )
+    return tmp_path
+
+
+def test_cache_paths_in_output_dir() -> None:
+    """
+    キャッシュファイルが共通の出力ディレクトリに置かれることをテストする。
+    """
+    assert dashboard._SEQNO_CACHE_PATH.parent == OUTPUT_DIR
+    assert dashboard._STAKING_INFO_CACHE_PATH.parent == OUTPUT_DIR
+
+
+@pytest.mark.asyncio
+async def test_get_block_by_unix_time_fetches_and_caches(
+    mocker: MockerFixture, cache_paths: Path
+) -> None:
+    """
+    キャッシュにない時刻は/block/utimeを取得し、結果をキャッシュすることをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    """
+    mock_get_json = mocker.patch.object(
+        dashboard,
+        "_get_json",
+        mocker.AsyncMock(
+            return_value={
+                "exist": True,
+                "block": {"shards": [{"seqno": 123, "timestamp": 1700000005}]},
+            }
+        ),
+    )
+    session = mocker.AsyncMock(spec=ClientSession)
+
+    seqno, timestamp = await dashboard.get_block_by_unix_time(session, 1700000000)
+
+    assert seqno == 123
+    assert timestamp == datetime.fromtimestamp(1700000005, tz=timezone.utc)
+    mock_get_json.assert_awaited_once_with(
+        session, "https://mainnet-v4.tonhubapi.com/block/utime/1700000000"
+    )
+    assert dashboard._get_cache(dashboard._SEQNO_CACHE_PATH) == {
+        "1700000000": [123, 1700000005]
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_block_by_unix_time_cache_hit(
+    mocker: MockerFixture, cache_paths: Path
+) -> None:
+    """
+    キャッシュ済みの時刻では/block/utimeへのリクエストを行わないことをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    """
+    dashboard._get_cache(dashboard._SEQNO_CACHE_PATH)["1700000000"] = [123, 1700000005]
+    mock_get_json = mocker.patch.object(dashboard, "_get_json", mocker.AsyncMock())
+
+    seqno, timestamp = await dashboard.get_block_by_unix_time(
+        mocker.AsyncMock(spec=ClientSession), 1700000000
+    )
+
+    assert seqno == 123
+    assert timestamp == datetime.fromtimestamp(1700000005, tz=timezone.utc)
+    mock_get_json.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_block_by_unix_time_missing_block_not_cached(
+    mocker: MockerFixture, cache_paths: Path
+) -> None:
+    """
+    存在しないブロックは(None, None)を返し、キャッシュされないことをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    """
+    mock_get_json = mocker.patch.object(
+        dashboard, "_get_json", mocker.AsyncMock(return_value={"exist": False})
+    )
+    session = mocker.AsyncMock(spec=ClientSession)
+
+    assert await dashboard.get_block_by_unix_time(session, 1700000000) == (None, None)
+    assert await dashboard.get_block_by_unix_time(session, 1700000000) == (None, None)
+
+    assert mock_get_json.await_count == 2
+    assert dashboard._get_cache(dashboard._SEQNO_CACHE_PATH) == {}
+
+
+@pytest.mark.asyncio
+async def test_seqno_cache_loaded_from_file(
+    mocker: MockerFixture, cache_paths: Path
+) -> None:
+    """
+    保存済みのキャッシュファイルから読み込んだ結果が使われることをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    """
+    dashboard._SEQNO_CACHE_PATH.write_text(json.dumps({"1700000000": [7, 1700000001]}))
+    mock_get_json = mocker.patch.object(dashboard, "_get_json", mocker.AsyncMock())
+
+    seqno, _ = await dashboard.get_block_by_unix_time(
+        mocker.AsyncMock(spec=ClientSession), 1700000000
+    )
+
+    assert seqno == 7
+    mock_get_json.assert_not_awaited()
+
+
+@pytest.mark.parametrize("content", ["not json", "[1, 2]"])
+def test_seqno_cache_invalid_file(cache_paths: Path, content: Any) -> None:
+    """
+    壊れたキャッシュファイルは空のキャッシュとして扱われることをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    :param content: キャッシュファイルの内容
+    """
+    dashboard._SEQNO_CACHE_PATH.write_text(content)
+
+    assert dashboard._get_cache(dashboard._SEQNO_CACHE_PATH) == {}
+
+
+def test_save_caches_writes_file(cache_paths: Path) -> None:
+    """
+    _save_caches関数が空でないキャッシュのみをファイルに保存することをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    """
+    dashboard._get_cache(dashboard._SEQNO_CACHE_PATH)["1700000000"] = [123, 1700000005]
+    dashboard._get_cache(dashboard._STAKING_INFO_CACHE_PATH)
+
+    dashboard._save_caches()
+
+    assert json.loads(dashboard._SEQNO_CACHE_PATH.read_text()) == {
+        "1700000000": [123, 1700000005]
+    }
+    assert not dashboard._STAKING_INFO_CACHE_PATH.exists()
+
+
+def test_cache_store_prunes_oldest_entries(
+    cache_paths: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    キャッシュが上限件数を超えた場合に古いエントリから削除されることをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    monkeypatch.setattr(dashboard, "_MAX_CACHE_ENTRIES", 2)
+
+    for i in range(3):
+        dashboard._cache_store(dashboard._SEQNO_CACHE_PATH, str(i), [i, i])
+
+    assert dashboard._get_cache(dashboard._SEQNO_CACHE_PATH) == {
+        "1": [1, 1],
+        "2": [2, 2],
+    }
+    assert dashboard._cache_lookup(dashboard._SEQNO_CACHE_PATH, "0") is None
+
+
+def test_cache_pruned_on_load(
+    cache_paths: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    上限件数を超えるキャッシュファイルが読み込み時に切り詰められることをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    monkeypatch.setattr(dashboard, "_MAX_CACHE_ENTRIES", 1)
+    dashboard._SEQNO_CACHE_PATH.write_text(json.dumps({"1": [1, 1], "2": [2, 2]}))
+
+    assert dashboard._get_cache(dashboard._SEQNO_CACHE_PATH) == {"2": [2, 2]}
+
+
+def test_save_caches_replaces_file_atomically(
+    cache_paths: Path, mocker: MockerFixture
+) -> None:
+    """
+    _save_caches関数が一時ファイル経由で置き換え、失敗時に既存ファイルと一時ファイルを残さないことをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    :param mocker: pytest-mockのMockerFixture
+    """
+    dashboard._SEQNO_CACHE_PATH.write_text(json.dumps({"old": [1, 1]}))
+    dashboard._cache_store(dashboard._SEQNO_CACHE_PATH, "new", [2, 2])
+
+    mocker.patch.object(dashboard.os, "replace", side_effect=OSError("disk full"))
+    dashboard._save_caches()
+
+    assert json.loads(dashboard._SEQNO_CACHE_PATH.read_text()) == {"old": [1, 1]}
+    assert [p.name for p in cache_paths.iterdir()] == [".seqno_cache.json"]
+
+    mocker.stopall()
+    dashboard._save_caches()
+
+    assert json.loads(dashboard._SEQNO_CACHE_PATH.read_text()) == {
+        "old": [1, 1],
+        "new": [2, 2],
+    }
+    assert [p.name for p in cache_paths.iterdir()] == [".seqno_cache.json"]
+
+
+def test_save_caches_snapshots_under_lock(
+    cache_paths: Path, mocker: MockerFixture
+) -> None:
+    """
+    _save_caches関数がロック下でキャッシュを複製し、書き込み中の更新の影響を受けないことをテストする。
+
+    :param cache_paths: キャッシュを一時ディレクトリに切り替えるフィクスチャ
+    :param mocker: pytest-mockのMockerFixture
+    """
+    dashboard._cache_store(dashboard._SEQNO_CACHE_PATH, "1", [1, 1])
+    real_dumps = dashboard.json_utils.dumps
+
+    def dumps_while_updating(obj: Any, indent: bool = False) -> bytes:
+        assert not dashboard._cache_lock.locked()
+        dashboard._cache_store(dashboard._SEQNO_CACHE_PATH, "2", [2, 2])
+        return real_dumps(obj, indent)
+
+    mocker.patch.object(dashboard.json_utils, "dumps", side_effect=dumps_while_updating)
+
+    dashboard._save_caches()
+
+    assert json.loads(dashboard._SEQNO_CACHE_PATH.read_text()) == {"1": [1, 1]}
+    assert dashboard._cache_lookup(dashboard._SEQNO_CACHE_PATH, "2") == [2, 2]
+
+
+@pytest.mark.parametrize(
+    "attempt, retry_after, expected",
+    [
+        (0, "3", 3.0),
+        (0, "-1", 0.0),
+        (0, "3600", 8.0),
+        (2, "nan", 2.0 + 0.25),
+        (2, "soon", 2.0 + 0.25),
+        (2, None, 2.0 + 0.25),
+        (10, None, 8.0 + 0.25),
+    ],
+)
+def test_retry_delay(
+    mocker: MockerFixture, attempt: int, retry_after: Any, expected: float
+) -> None:
+    """
+    _retry_delay関数のテスト。
+
+    有効なRetry-Afterは上限内で優先され、欠落・不正値・NaNの場合は
+    ジッター付きの指数バックオフになることを確認する。
+
+    :param mocker: pytest-mockのMockerFixture
+    :param attempt: 試行回数(0始まり)
+    :param retry_after: Retry-Afterヘッダーの値
+    :param expected: 期待される待機秒数
+    """
+    mocker.patch.object(dashboard.random, "random", return_value=0.25)
+
+    assert dashboard._retry_delay(attempt, retry_after) == expected
+
+
+def _mock_response(
+    mocker: MockerFixture, status: int, body: bytes = b"{}", headers: Any = None
+) -> Any:
+    response = mocker.AsyncMock(spec=ClientResponse)
+    response.status = status
+    response.headers = headers or {}
+    response.read.return_value = body
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_json_retries_transient_statuses(mocker: MockerFixture) -> None:
+    """
+    _get_json関数が429/5xxをRetry-Afterに従って再試行し、成功したレスポンスを返すことをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    session = mocker.AsyncMock(spec=ClientSession)
+    session.get = mocker.AsyncMock()
+    session.get.side_effect = [
+        _mock_response(mocker, 429, headers={"Retry-After": "2"}),
+        _mock_response(mocker, 503, headers={"Retry-After": "nan"}),
+        _mock_response(mocker, 200, b'{"ok": true}'),
+    ]
+    mocker.patch.object(dashboard.random, "random", return_value=0.0)
+    mock_sleep = mocker.patch(
+        "ton_txns_data_conv.staking.ton_whales_staking_dashboard.asyncio.sleep",
+        mocker.AsyncMock(),
+    )
+
+    assert await dashboard._get_json(session, "https://example.com") == {"ok": True}
+
+    assert session.get.await_count == 3
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_get_json_gives_up_after_max_attempts(mocker: MockerFixture) -> None:
+    """
+    _get_json関数が_MAX_ATTEMPTS回で再試行をやめ、最後のレスポンスを解析することをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    session = mocker.AsyncMock(spec=ClientSession)
+    session.get = mocker.AsyncMock()
+    session.get.side_effect = [
+        _mock_response(mocker, 500, b'{"error": "busy"}')
+        for _ in range(dashboard._MAX_ATTEMPTS)
+    ]
+    mock_sleep = mocker.patch(
+        "ton_txns_data_conv.staking.ton_whales_staking_dashboard.asyncio.sleep",
+        mocker.AsyncMock(),
+    )
+
+    result = await dashboard._get_json(session, "https://example.com")
+
+    assert result == {"error": "busy"}
+    assert session.get.await_count == dashboard._MAX_ATTEMPTS
+    assert mock_sleep.await_count == dashboard._MAX_ATTEMPTS - 1
+
+
+@pytest.mark.asyncio
+async def test_get_json_does_not_retry_client_errors(mocker: MockerFixture) -> None:
+    """
+    _get_json関数が再試行対象外のステータスでは再試行しないことをテストする。
+
+    :param mocker: pytest-mockのMockerFixture
+    """
+    session = mocker.AsyncMock(spec=ClientSession)
+    session.get = mocker.AsyncMock()
+    session.get.return_value = _mock_response(mocker, 404, b'{"exist": false}')
+    mock_sleep = mocker.patch(
+        "ton_txns_data_conv.staking.ton_whales_staking_dashboard.asyncio.sleep",
+        mocker.AsyncMock(),
+    )
+
+    assert await dashboard._get_json(session, "https://example.com") == {"exist": False}
+    session.get.assert_awaited_once()
+    mock_sleep.assert_not_awaited()
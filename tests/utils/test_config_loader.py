@@ -4,6 +4,7 @@ from typing import Any
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+from ton_txns_data_conv.utils import config_loader
 from ton_txns_data_conv.utils.config_loader import find_config_file, load_config
 
 
@@ -183,3 +184,56 @@ def test_load_config_empty_file(
     config = load_config()
     assert isinstance(config, dict)
     assert len(config) == 0
+
+
+def test_load_config_cached_until_file_changes(
+    mock_config_loader: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    load_config関数が解析結果をキャッシュし、ファイル更新時に再読み込みすることをテストする。
+
+    Given: 一度読み込んだ設定ファイル
+    When: ファイルを変更せずに再度読み込み、その後ファイルを書き換えて読み込む
+    Then: 未変更時は解析済みの内容が返り、変更後は新しい内容が返される
+    """
+    config_file = mock_config_loader / "ton_txns_data_conv" / "cached_config.toml"
+    config_file.write_text('[ton_info]\nuser_friendly_address = "first"\n')
+    monkeypatch.setattr(
+        "ton_txns_data_conv.utils.config_loader.find_config_file",
+        lambda *args: config_file,
+    )
+
+    config_loader._parse_config.cache_clear()
+
+    first = load_config()
+    assert load_config() == first
+    assert config_loader._parse_config.cache_info().hits == 1
+
+    config_file.write_text('[ton_info]\nuser_friendly_address = "second_value"\n')
+    assert load_config()["ton_info"]["user_friendly_address"] == "second_value"
+
+
+def test_load_config_returns_independent_copies(
+    mock_config_loader: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    load_config関数が呼び出しごとに独立した辞書を返すことをテストする。
+
+    Given: 一度読み込んだ設定ファイル
+    When: 返された辞書を書き換えてから再度読み込む
+    Then: 書き換えはキャッシュに影響せず、ファイルの内容が返される
+    """
+    config_file = mock_config_loader / "ton_txns_data_conv" / "copied_config.toml"
+    config_file.write_text('[ton_info]\nuser_friendly_address = "original"\n')
+    monkeypatch.setattr(
+        "ton_txns_data_conv.utils.config_loader.find_config_file",
+        lambda *args: config_file,
+    )
+
+    first = load_config()
+    first["ton_info"]["user_friendly_address"] = "mutated"
+    first["extra"] = {}
+
+    second = load_config()
+    assert second["ton_info"]["user_friendly_address"] == "original"
+    assert "extra" not in second
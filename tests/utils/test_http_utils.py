@@ -0,0 +1,35 @@
+from typing import Any
+
+import pytest
+from freezegun import freeze_time
+
+from ton_txns_data_conv.utils import http_utils
+
+
+@freeze_time("2024-08-14 00:00:00")
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, 2.0),
+        ("1.5", 1.5),
+        ("-5", 0.0),
+        ("3600", 8.0),
+        ("inf", 8.0),
+        ("nan", 2.0),
+        ("Wed, 14 Aug 2024 00:00:05 GMT", 5.0),
+        ("Wed, 14 Aug 2024 01:00:00 GMT", 8.0),
+        ("Tue, 13 Aug 2024 23:59:00 GMT", 0.0),
+        ("not a date", 2.0),
+    ],
+)
+def test_retry_after_seconds(value: Any, expected: float) -> None:
+    """
+    retry_after_seconds関数のテスト。
+
+    秒数形式とHTTP-date形式のRetry-Afterを解釈し、欠落・不正値・NaNは既定値、
+    負値は0、過大な値は上限に丸められることを確認する。
+
+    :param value: Retry-Afterヘッダーの値
+    :param expected: 期待される待機秒数
+    """
+    assert http_utils.retry_after_seconds(value, 2.0, 8.0) == expected
@@ -0,0 +1,95 @@
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from ton_txns_data_conv.utils import json_utils
+
+
+@pytest.fixture
+def sample_data() -> Any:
+    """
+    テスト用のJSONデータを提供するフィクスチャ。
+
+    :return: テスト用のデータ
+    """
+    return [{"hash": "test_hash", "now": 1628097600, "in_msg": {"value": "1"}}]
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch: MonkeyPatch) -> None:
+    """
+    orjsonが利用できない環境をモックするフィクスチャ。
+
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    monkeypatch.setattr(json_utils, "HAS_ORJSON", False)
+
+
+def test_dumps_indent_stdlib(sample_data: Any, stdlib_only: None) -> None:
+    """
+    orjsonがない場合にdumps関数がインデント付きJSONを返すことをテストする。
+
+    :param sample_data: テスト用のデータ
+    :param stdlib_only: orjsonを無効化するフィクスチャ
+    """
+    result = json_utils.dumps(sample_data, indent=True)
+    assert result == json.dumps(sample_data, indent=2).encode("utf-8")
+
+
+def test_dumps_compact_stdlib(sample_data: Any, stdlib_only: None) -> None:
+    """
+    orjsonがない場合にdumps関数が空白なしのJSONを返すことをテストする。
+
+    :param sample_data: テスト用のデータ
+    :param stdlib_only: orjsonを無効化するフィクスチャ
+    """
+    result = json_utils.dumps(sample_data)
+    assert b" " not in result
+    assert json.loads(result) == sample_data
+
+
+def test_loads_stdlib(sample_data: Any, stdlib_only: None) -> None:
+    """
+    orjsonがない場合にloads関数がbytesとstrの両方を読み込めることをテストする。
+
+    :param sample_data: テスト用のデータ
+    :param stdlib_only: orjsonを無効化するフィクスチャ
+    """
+    encoded = json.dumps(sample_data)
+    assert json_utils.loads(encoded) == sample_data
+    assert json_utils.loads(encoded.encode("utf-8")) == sample_data
+
+
+def test_loads_invalid_raises_value_error(stdlib_only: None) -> None:
+    """
+    不正なJSONに対してloads関数がValueErrorを送出することをテストする。
+
+    :param stdlib_only: orjsonを無効化するフィクスチャ
+    """
+    with pytest.raises(ValueError):
+        json_utils.loads(b"not json")
+
+
+def test_orjson_is_used_when_available(
+    sample_data: Any, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    orjsonが利用可能な場合にorjsonが使用されることをテストする。
+
+    :param sample_data: テスト用のデータ
+    :param monkeypatch: pytestのmonkeypatchフィクスチャ
+    """
+    fake_orjson = SimpleNamespace(
+        OPT_INDENT_2=1,
+        dumps=lambda obj, option=0: b"orjson-dumps:%d" % option,
+        loads=lambda data: "orjson-loads",
+    )
+    monkeypatch.setattr(json_utils, "HAS_ORJSON", True)
+    monkeypatch.setattr(json_utils, "orjson", fake_orjson, raising=False)
+
+    assert json_utils.dumps(sample_data, indent=True) == b"orjson-dumps:1"
+    assert json_utils.dumps(sample_data) == b"orjson-dumps:0"
+    assert json_utils.loads(b"[]") == "orjson-loads"
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from ton_txns_data_conv.utils import output_dir
+
+
+def test_output_dir_location() -> None:
+    """
+    OUTPUT_DIRがパッケージ直下のoutputディレクトリを指すことをテストする。
+    """
+    package_dir = Path(output_dir.__file__).resolve().parents[1]
+    assert output_dir.OUTPUT_DIR == package_dir / "output"
+
+
+def test_ensure_output_dir_creates_once(tmp_path: Path) -> None:
+    """
+    ensure_output_dir関数が出力ディレクトリを作成し、同じパスを返すことをテストする。
+
+    :param tmp_path: pytest提供の一時ディレクトリパス
+    """
+    target = tmp_path / "output"
+
+    assert output_dir.ensure_output_dir(target) == target
+    assert target.is_dir()
+
+    target.rmdir()
+    # The result is cached per path, so the directory is not created again.
+    assert output_dir.ensure_output_dir(target) == target
+    assert not target.exists()
@@ -1,21 +1,70 @@
+import gzip
 import json
+import os
 import sys
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 project_root = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
+from ton_txns_data_conv.utils import json_utils
 from ton_txns_data_conv.utils.config_loader import load_config
+from ton_txns_data_conv.utils.http_utils import retry_after_seconds
+from ton_txns_data_conv.utils.output_dir import OUTPUT_DIR, ensure_output_dir
+
+# Below this many remaining requests in the current window, pause before the next page.
+_RATE_LIMIT_REMAINING_THRESHOLD = 1
+# Pause used when Retry-After is missing or unparsable, and the cap for very large values.
+_RATE_LIMIT_DEFAULT_WAIT_SECONDS = 1.0
+_RATE_LIMIT_MAX_WAIT_SECONDS = 60.0
+
+# Connection pool sizes for the shared HTTP session.
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 8
+
+# Precomputed divisors for nano_to_amount (10**0 .. 10**18).
+_POW10 = tuple(10**i for i in range(19))
+_NANO_DIV = _POW10[9]
 
 
 def nano_to_amount(value: int, precision: int = 9) -> float:  # pragma: no cover
     """Converts a value from nanoton to TON without rounding.
 
+    Args:
+        value (int): The value to convert, in nanoton. This should be a positive integer.
+        precision (int, optional): The number of decimal places to include in the converted value. Defaults to 9.
+
+    Returns:
+        float: The converted value in TON.
+
+    Note:
+        - No input validation is performed so the function stays cheap in per-transaction loops.
+          Use nano_to_amount_checked for values coming from untrusted input.
+    """
+    if precision == 9:
+        result: float = value / _NANO_DIV
+    elif 0 <= precision < len(_POW10):
+        result = value / _POW10[precision]
+    else:
+        result = value / (10**precision)
+    return result
+
+
+def nano_to_amount_checked(value: int, precision: int = 9) -> float:
+    """Converts a value from nanoton to TON after validating the arguments.
+
     Args:
         value (int): The value to convert, in nanoton. This should be a positive integer.
         precision (int, optional): The number of decimal places to include in the converted value. Defaults to 9.
@@ -32,8 +81,131 @@ def nano_to_amount(value: int, precision: int = 9) -> float:  # pragma: no cover
     if not isinstance(precision, int) or precision < 0:
         raise ValueError("Precision must be a non-negative integer.")
 
-    result: float = value / (10**precision)
-    return result
+    return nano_to_amount(value, precision)
+
+
+def nano_to_amount_decimal(value: int, precision: int = 9) -> Decimal:
+    """Converts a value from nanoton to TON exactly, using Decimal.
+
+    Args:
+        value (int): The value to convert, in nanoton. This should be a positive integer.
+        precision (int, optional): The number of decimal places to shift the value by. Defaults to 9.
+
+    Returns:
+        Decimal: The converted value in TON, without any floating-point rounding.
+
+    Raises:
+        ValueError: If the value is not a positive integer or the precision is not a non-negative integer.
+
+    Example:
+        >>> nano_to_amount_decimal(1234567890123456789)
+        Decimal('1234567890.123456789')
+    """
+    if not isinstance(value, int) or value < 0:
+        raise ValueError("Value must be a positive integer.")
+
+    if not isinstance(precision, int) or precision < 0:
+        raise ValueError("Precision must be a non-negative integer.")
+
+    return Decimal(value).scaleb(-precision)
+
+
+def create_session() -> requests.Session:
+    """Creates a requests session that retries throttled and failed requests.
+
+    Returns:
+        requests.Session: A session whose adapter retries 429 and 5xx responses with
+        exponential backoff, honoring the Retry-After header sent by the server.
+        JSON is requested by default through the session-level accept header.
+    """
+    session = requests.Session()
+    session.headers["accept"] = "application/json"
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Returns the process-wide session shared by the API helpers in this module.
+
+    Returns:
+        requests.Session: A session created by create_session on first use.
+
+    Note:
+        - Reusing one session keeps TCP/TLS connections alive across calls and accounts.
+    """
+    return create_session()
+
+
+def _retry_after_seconds(value: Optional[str]) -> float:
+    """Converts a Retry-After header value into the number of seconds to pause.
+
+    Args:
+        value (Optional[str]): The header value, either delay-seconds or an HTTP-date (RFC 9110).
+
+    Returns:
+        float: The delay in seconds, clamped to [0, _RATE_LIMIT_MAX_WAIT_SECONDS]. Missing or
+        unparsable values fall back to _RATE_LIMIT_DEFAULT_WAIT_SECONDS.
+    """
+    return retry_after_seconds(
+        value, _RATE_LIMIT_DEFAULT_WAIT_SECONDS, _RATE_LIMIT_MAX_WAIT_SECONDS
+    )
+
+
+def _wait_for_rate_limit(response: requests.Response) -> None:
+    """Sleeps only when the response indicates that the rate limit is nearly exhausted.
+
+    Args:
+        response (requests.Response): The last successful response.
+
+    Note:
+        - If the server does not send an x-ratelimit-remaining header, no sleep is performed;
+          throttled requests are retried by the session adapter instead.
+    """
+    remaining = response.headers.get("x-ratelimit-remaining")
+    if remaining is None or not remaining.isdigit():
+        return
+    if int(remaining) < _RATE_LIMIT_REMAINING_THRESHOLD:
+        time.sleep(_retry_after_seconds(response.headers.get("Retry-After")))
+
+
+def _write_json_records(
+    write: Callable[[bytes], Any], data: List[Dict[str, Any]], ndjson: bool
+) -> None:
+    """Writes the records one at a time instead of serializing the whole list up front.
+
+    Args:
+        write (Callable[[bytes], Any]): The write method of a file opened in binary mode.
+        data (List[Dict[str, Any]]): The records to write.
+        ndjson (bool): If True, write one JSON object per line; otherwise write a compact JSON array.
+
+    Note:
+        - Peak memory is bounded by the largest single record rather than the whole serialized list.
+    """
+    if ndjson:
+        for record in data:
+            write(json_utils.dumps(record))
+            write(b"\n")
+        return
+
+    write(b"[")
+    for i, record in enumerate(data):
+        if i:
+            write(b",")
+        write(json_utils.dumps(record))
+    write(b"]")
 
 
 def save_json_file(data: List[Dict[str, Any]], filename: str) -> None:
@@ -46,17 +218,24 @@ def save_json_file(data: List[Dict[str, Any]], filename: str) -> None:
     Note:
         - The function creates an 'output' directory if it does not already exist.
         - If a file with the specified filename already exists, the user is prompted for confirmation before overwriting it.
-        - The JSON file is saved with an indentation of 2 spaces.
+        - The JSON file is saved with an indentation of 2 spaces. orjson is used for serialization
+          when it is installed.
+        - If the filename ends with '.gz' (e.g. 'example.json.gz'), the JSON is written compactly
+          through gzip instead, which shrinks large transaction histories several times over.
+        - If the filename ends with '.ndjson' (or '.ndjson.gz'), one transaction is written per line.
+        - Compact and newline-delimited outputs are streamed record by record, so very long histories
+          are never held in memory as one serialized string.
 
     Example:
         >>> data = [{'key1': 'value1', 'key2': 'value2'}, {'key1': 'value3', 'key2': 'value4'}]
         >>> save_json_file(data, "example.json")
         JSON file saved: /path/to/output/example.json
+        >>> save_json_file(data, "example.json.gz")
+        JSON file saved: /path/to/output/example.json.gz
+        >>> save_json_file(data, "example.ndjson")
+        JSON file saved: /path/to/output/example.ndjson
     """
-    # output_dir = Path(__file__).parent / "output"
-    output_dir = project_root / "ton_txns_data_conv" / "output"
-    output_dir.mkdir(exist_ok=True)
-    json_file_path = output_dir / filename
+    json_file_path = ensure_output_dir(OUTPUT_DIR) / filename
 
     if json_file_path.exists():
         overwrite = input(f"{json_file_path} already exists. Overwrite? (y/N) ")
@@ -64,11 +243,106 @@ def save_json_file(data: List[Dict[str, Any]], filename: str) -> None:
             print("File not saved.")
             return
 
-    with open(json_file_path, "w") as f:
-        json.dump(data, f, indent=2)
+    compress = json_file_path.suffix == ".gz"
+    inner_suffix = (
+        json_file_path.with_suffix("").suffix if compress else json_file_path.suffix
+    )
+    ndjson = inner_suffix == ".ndjson"
+
+    if compress:
+        with gzip.open(json_file_path, "wb", compresslevel=6) as gz_file:
+            _write_json_records(gz_file.write, data, ndjson)
+    elif ndjson:
+        with open(json_file_path, "wb") as f:
+            _write_json_records(f.write, data, ndjson)
+    else:
+        with open(json_file_path, "wb") as f:
+            f.write(json_utils.dumps(data, indent=True))
     print(f"JSON file saved: {json_file_path}")
 
 
+# Suffixes save_json_file can write transactions with.
+_TRANSACTIONS_FILE_SUFFIXES = (".json", ".json.gz", ".ndjson", ".ndjson.gz")
+
+
+def _transactions_file_stem(
+    account: str,
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    prefix: str = "all_txns_tonindex_v3",
+) -> str:
+    """Builds the part of a transactions filename that identifies the account and period.
+
+    Args:
+        account (str): The TON account address the transactions belong to.
+        start_time (Optional[datetime]): The start of the fetched period, or None if unbounded.
+        end_time (Optional[datetime]): The end of the fetched period, or None if unbounded.
+        prefix (str, optional): The filename prefix. Defaults to "all_txns_tonindex_v3".
+
+    Returns:
+        str: A filename stem such as 'all_txns_tonindex_v3_EQAbc..._20240715-20240814'.
+    """
+    start = f"{start_time:%Y%m%d}" if start_time else "any"
+    end = f"{end_time:%Y%m%d}" if end_time else "any"
+    # Raw addresses ('0:abc...') contain a colon, which is not allowed in Windows filenames.
+    return f"{prefix}_{account.replace(':', '_')}_{start}-{end}"
+
+
+def find_saved_transactions_file(
+    account: str,
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    prefix: str = "all_txns_tonindex_v3",
+) -> Optional[Path]:
+    """Finds a transactions file saved today for the same account and period in the 'output' directory.
+
+    Args:
+        account (str): The TON account address the transactions must belong to.
+        start_time (Optional[datetime]): The start of the period the file must cover.
+        end_time (Optional[datetime]): The end of the period the file must cover.
+        prefix (str, optional): The filename prefix used when the file was saved. Defaults to "all_txns_tonindex_v3".
+
+    Returns:
+        Optional[Path]: The most recently modified matching file, or None if nothing was saved today.
+
+    Note:
+        - Only files named like those written by get_transactions_v3 with save_json=True are considered
+          (e.g. 'all_txns_tonindex_v3_EQAbc..._20240715-20240814_N=120_2024-08-14.json'), including
+          their '.json.gz', '.ndjson' and '.ndjson.gz' variants.
+        - Files saved for another account or another period (compared by date) are never returned.
+    """
+    stem = _transactions_file_stem(account, start_time, end_time, prefix)
+    matches = [
+        path
+        for path in OUTPUT_DIR.glob(f"{stem}_N=*_{date.today()}.*")
+        if path.name.endswith(_TRANSACTIONS_FILE_SUFFIXES)
+    ]
+    if not matches:
+        return None
+    return max(matches, key=os.path.getmtime)
+
+
+def load_json_file(json_file_path: Path) -> List[Dict[str, Any]]:
+    """Loads a list of transactions previously written by save_json_file.
+
+    Args:
+        json_file_path (Path): The path of the JSON file to load. Files ending with '.gz' are decompressed,
+            and '.ndjson' files are read one transaction per line.
+
+    Returns:
+        List[Dict[str, Any]]: The transactions stored in the file.
+    """
+    raw = json_file_path.read_bytes()
+    inner_path = json_file_path
+    if json_file_path.suffix == ".gz":
+        raw = gzip.decompress(raw)
+        inner_path = json_file_path.with_suffix("")
+    if inner_path.suffix == ".ndjson":
+        return [json_utils.loads(line) for line in raw.splitlines() if line.strip()]
+    data: List[Dict[str, Any]] = json_utils.loads(raw)
+    return data
+
+
 def get_recieve_txn_tonapi(
     account_id: str, limit: int = 100, sort_order: str = "desc", save_json: bool = False
 ) -> List[Dict[str, Any]]:  # pragma: no cover
@@ -90,6 +364,8 @@ def get_recieve_txn_tonapi(
         - If save_json is True, the raw JSON response is saved to a file in the 'output' directory.
         - The filename for the JSON file includes the number of transactions and the current date.
         - This function does not require an API key, as it uses the public TON API endpoint.
+        - An HTTP error response (e.g. an exhausted rate limit) raises requests.HTTPError instead of
+          surfacing later as a missing 'transactions' key.
 
     Example:
         >>> account_id = "your_account_id(User-friendly address)"
@@ -99,10 +375,10 @@ def get_recieve_txn_tonapi(
     """
     url = f"https://tonapi.io/v2/blockchain/accounts/{account_id}/transactions"
     params: Dict[str, Union[int, str]] = {"limit": limit, "sort_order": sort_order}
-    headers = {"accept": "application/json"}
 
-    response = requests.get(url, params=params, headers=headers)
-    data = response.json()
+    response = _get_session().get(url, params=params)
+    response.raise_for_status()
+    data = json_utils.loads(response.content)
     transactions_dict = data["transactions"]
     assert isinstance(transactions_dict, list), "Expected a list of transactions"
 
@@ -115,63 +391,48 @@ def get_recieve_txn_tonapi(
     return transactions_dict
 
 
-def get_transactions_v3(
+def _fetch_transactions_window(
+    session: requests.Session,
     account: str,
-    start_time: Optional[datetime] = None,
-    end_time: Optional[datetime] = None,
-    limit: int = 100,
-    offset: int = 0,
-    save_json: bool = False,
+    start_utime: Optional[int],
+    end_utime: Optional[int],
+    limit: int,
 ) -> List[Dict[str, Any]]:
-    """Retrieves transactions for a TON account using the TON Index API v3.
+    """Fetches every transaction in one time window, following the keyset cursor page by page.
 
     Args:
+        session (requests.Session): The session used to send the requests.
         account (str): The TON account address to fetch transactions for.
-        start_time (Optional[datetime], optional): The start time for the transaction query. Defaults to None.
-        end_time (Optional[datetime], optional): The end time for the transaction query. Defaults to None.
-        limit (int, optional): The maximum number of transactions to retrieve per request. Defaults to 100.
-        offset (int, optional): The offset for pagination. Defaults to 0.
-        save_json (bool, optional): Whether to save the raw JSON response to a file. Defaults to False.
+        start_utime (Optional[int]): The inclusive lower bound of the window as a Unix timestamp.
+        end_utime (Optional[int]): The inclusive upper bound of the window as a Unix timestamp.
+        limit (int): The maximum number of transactions to retrieve per request.
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a transaction.
+        List[Dict[str, Any]]: The transactions in the window, newest first.
 
     Note:
-        - This function uses the TON Index API v3 to fetch transactions for the specified account.
-        - The function will make multiple API calls if necessary to retrieve all transactions within the specified time range.
-        - If start_time and end_time are not provided, the API will return the most recent transactions.
-        - The transactions are returned as a list of dictionaries, with each dictionary containing the full
-          transaction data as provided by the API.
-        - If save_json is True, the raw JSON response is saved to a file in the 'output' directory.
-        - The filename for the JSON file includes the number of transactions and the current date.
-        - This function implements error handling and will retry failed requests with a delay.
-
-    Example:
-        >>> account = "YOUR_ACCOUNT"
-        >>> start = datetime(2024, 1, 1)
-        >>> end = datetime(2024, 7, 1)
-        >>> transactions = get_transactions_v3(account, start_time=start, end_time=end, save_json=True)
-        >>> len(transactions)
-        500
+        - Request and JSON decode errors stop the window early and return what was fetched so far.
     """
     base_url = "https://toncenter.com/api/v3/transactions"
-    all_transactions = []
+    transactions_in_window: List[Dict[str, Any]] = []
+    end_lt: Optional[int] = None
 
     while True:
         params: Dict[str, Union[str, int]] = {
             "account": account,
             "limit": limit,
-            "offset": offset,
             "sort": "desc",
         }
 
-        if start_time:
-            params["start_utime"] = int(start_time.timestamp())
-        if end_time:
-            params["end_utime"] = int(end_time.timestamp())
+        if start_utime is not None:
+            params["start_utime"] = start_utime
+        if end_utime is not None:
+            params["end_utime"] = end_utime
+        if end_lt is not None:
+            params["end_lt"] = end_lt
 
         try:
-            response = requests.get(base_url, params=params)
+            response = session.get(base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -179,13 +440,16 @@ def get_transactions_v3(
             if not transactions:
                 break
 
-            all_transactions.extend(transactions)
-            offset += len(transactions)
+            transactions_in_window.extend(transactions)
 
             if len(transactions) < limit:
                 break
 
-            time.sleep(1)
+            # lt is unique per account, so an inclusive end_lt just below the last one
+            # can never return a transaction from the previous page.
+            end_lt = int(transactions[-1]["lt"]) - 1
+
+            _wait_for_rate_limit(response)
 
         except requests.exceptions.RequestException as e:
             print(f"Request error: {e}")
@@ -194,8 +458,128 @@ def get_transactions_v3(
             print("JSON decode error. The response is not valid JSON.")
             break
 
+    return transactions_in_window
+
+
+def _split_time_window(
+    start_utime: int, end_utime: int, parts: int
+) -> List[Tuple[int, int]]:
+    """Splits [start_utime, end_utime] into consecutive, non-overlapping sub-windows.
+
+    Args:
+        start_utime (int): The inclusive lower bound as a Unix timestamp.
+        end_utime (int): The inclusive upper bound as a Unix timestamp.
+        parts (int): The desired number of sub-windows.
+
+    Returns:
+        List[Tuple[int, int]]: Inclusive (start, end) pairs ordered from oldest to newest.
+        Fewer than `parts` windows are returned when the range is too short to split.
+    """
+    parts = max(1, min(parts, end_utime - start_utime + 1))
+    edges = [
+        start_utime + (end_utime - start_utime + 1) * i // parts
+        for i in range(parts + 1)
+    ]
+    return [(edges[i], edges[i + 1] - 1) for i in range(parts)]
+
+
+def get_transactions_v3(
+    account: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    limit: int = 100,
+    offset: Optional[int] = None,
+    save_json: bool = False,
+    max_workers: int = 1,
+) -> List[Dict[str, Any]]:
+    """Retrieves transactions for a TON account using the TON Index API v3.
+
+    Args:
+        account (str): The TON account address to fetch transactions for.
+        start_time (Optional[datetime], optional): The start time for the transaction query. Defaults to None.
+        end_time (Optional[datetime], optional): The end time for the transaction query. Defaults to None.
+        limit (int, optional): The maximum number of transactions to retrieve per request. Defaults to 100.
+        offset (Optional[int], optional): Deprecated. The number of newest transactions to skip.
+            Pagination no longer uses an offset; the value is applied to the merged result instead.
+            Defaults to None.
+        save_json (bool, optional): Whether to save the raw JSON response to a file. Defaults to False.
+        max_workers (int, optional): The number of time windows fetched concurrently. Defaults to 1.
+            Values above the connection pool size (_POOL_MAXSIZE) are clamped to it.
+
+    Returns:
+        List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a transaction.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+
+    Note:
+        - This function uses the TON Index API v3 to fetch transactions for the specified account.
+        - The function will make multiple API calls if necessary to retrieve all transactions within the specified time range.
+        - Pagination uses the logical time (lt) of the last transaction on each page as a keyset cursor
+          (end_lt) instead of an offset, so every page costs the server O(limit) regardless of its position.
+        - When max_workers is greater than 1 and both start_time and end_time are given, the interval is
+          split into max_workers sub-windows that are paginated concurrently on the shared session, so
+          network latency overlaps across windows. The merged result is deduplicated by hash and sorted
+          newest first. Keep max_workers within the rate limit of your API plan.
+        - If start_time and end_time are not provided, the API will return the most recent transactions.
+        - The transactions are returned as a list of dictionaries, with each dictionary containing the full
+          transaction data as provided by the API.
+        - If save_json is True, the raw JSON response is saved to a file in the 'output' directory.
+        - The filename for the JSON file includes the account, the requested period, the number of
+          transactions and the current date, so find_saved_transactions_file only reuses a matching pull.
+        - Throttled (429) and transient server errors (5xx) are retried with exponential backoff,
+          honoring Retry-After. Pages are otherwise requested back-to-back unless the server reports
+          that the rate limit is nearly exhausted.
+
+    Example:
+        >>> account = "YOUR_ACCOUNT"
+        >>> start = datetime(2024, 1, 1)
+        >>> end = datetime(2024, 7, 1)
+        >>> transactions = get_transactions_v3(account, start_time=start, end_time=end, save_json=True)
+        >>> len(transactions)
+        500
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    # More threads than pooled connections would only churn connections and the rate limit.
+    max_workers = min(max_workers, _POOL_MAXSIZE)
+
+    if offset is not None:
+        warnings.warn(
+            "The offset argument of get_transactions_v3 is deprecated and will be removed; "
+            "pagination now uses the lt cursor.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    session = _get_session()
+    start_utime = int(start_time.timestamp()) if start_time else None
+    end_utime = int(end_time.timestamp()) if end_time else None
+
+    if max_workers > 1 and start_utime is not None and end_utime is not None:
+        windows = _split_time_window(start_utime, end_utime, max_workers)
+        with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+            pages = executor.map(
+                lambda window: _fetch_transactions_window(
+                    session, account, window[0], window[1], limit
+                ),
+                windows,
+            )
+            unique = {tx["hash"]: tx for page in pages for tx in page}
+        all_transactions = sorted(
+            unique.values(), key=lambda tx: int(tx["lt"]), reverse=True
+        )
+    else:
+        all_transactions = _fetch_transactions_window(
+            session, account, start_utime, end_utime, limit
+        )
+
+    if offset:
+        all_transactions = all_transactions[offset:]
+
     if save_json and all_transactions:
-        filename = f"all_txns_tonindex_v3_N={len(all_transactions)}_{date.today()}.json"
+        stem = _transactions_file_stem(account, start_time, end_time)
+        filename = f"{stem}_N={len(all_transactions)}_{date.today()}.json"
         save_json_file(all_transactions, filename)
 
     return all_transactions
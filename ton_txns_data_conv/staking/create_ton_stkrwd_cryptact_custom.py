@@ -1,115 +1,169 @@
+import argparse
+import csv
 import datetime
+import gzip
 import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
-
-import pandas as pd
-import pytz
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, TextIO, Tuple, Union
+from zoneinfo import ZoneInfo
 
 project_root = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 
 from ton_txns_data_conv.account.get_ton_txns_api import (
+    find_saved_transactions_file,
     get_transactions_v3,
-    nano_to_amount,
+    load_json_file,
 )
 from ton_txns_data_conv.utils.config_loader import load_config
+from ton_txns_data_conv.utils.output_dir import OUTPUT_DIR, ensure_output_dir
+
+CSV_HEADER = (
+    "Timestamp",
+    "Action",
+    "Source",
+    "Base",
+    "Volume",
+    "Price",
+    "Counter",
+    "Fee",
+    "FeeCcy",
+    "Comment",
+)
 
+# Constant columns before (Action, Source, Base) and after (Price, Counter, Fee, FeeCcy) Volume.
+_ROW_PREFIX = ("STAKING", "TON_WALLET", "TON")
+_ROW_SUFFIX = ("", "JPY", 0, "TON")
 
-def create_cryptact_custom_data(
-    transaction: Dict[str, Any], transaction_timezone: str = "Asia/Tokyo"
-) -> Optional[List[Union[str, int, float]]]:
-    in_msg = transaction.get("in_msg", {})
+# Names resolved to the fixed-offset datetime.timezone.utc, which needs no transition lookup.
+_UTC_NAMES = frozenset({"UTC", "Etc/UTC"})
+
+# Shared read-only stand-in for a missing in_msg, so no throwaway dict is built per row.
+_EMPTY_MSG: Mapping[str, Any] = MappingProxyType({})
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(name: str) -> datetime.tzinfo:
+    if name in _UTC_NAMES:
+        return datetime.timezone.utc
+    return ZoneInfo(name)
+
+
+def _extract_fields(
+    transaction: Dict[str, Any], tz: datetime.tzinfo
+) -> Optional[Tuple[int, str, str, str]]:
+    # Only the Unix time (sort key) and the per-transaction columns (Timestamp, Volume, hash)
+    # are kept; the constant columns are added by _expand_row when the row is written.
+    in_msg = transaction.get("in_msg") or _EMPTY_MSG
     txn_val = in_msg.get("value")
-    timestamp_field = "now"
+    # The APIs return the value as a decimal string; reject the common "0" without parsing it.
+    if not txn_val or txn_val == "0":
+        return None
+    val_int = int(txn_val)
+    if val_int == 0:
+        return None
+    # divmod floors toward negative infinity, so a negative amount would be formatted wrongly.
+    if val_int < 0:
+        raise ValueError("Value must be a positive integer.")
+
+    txn_hash = transaction["hash"]
+
+    # Use timezone-aware datetime
+    utime = int(transaction["now"])
+    local_time = datetime.datetime.fromtimestamp(utime, tz)
+    # Equivalent to strftime("%Y/%m/%d %H:%M:%S"), but avoids the locale-aware formatter.
+    time_str = (
+        f"{local_time.year:04}/{local_time.month:02}/{local_time.day:02} "
+        f"{local_time.hour:02}:{local_time.minute:02}:{local_time.second:02}"
+    )
+    # TON has exactly 9 decimals, so format the nanoton integer directly without a float round trip.
+    whole, frac = divmod(val_int, 1_000_000_000)
+    value_ton = f"{whole}.{frac:09d}"
 
-    if txn_val and int(txn_val) != 0:
-        txn_hash = transaction["hash"]
+    return utime, f"'{time_str}", value_ton, txn_hash
 
-        # Use timezone-aware datetime
-        utc_time = datetime.datetime.fromtimestamp(
-            int(transaction[timestamp_field]), datetime.timezone.utc
-        )
-        tz = pytz.timezone(transaction_timezone)
-        local_time = utc_time.astimezone(tz)
-        time_str = local_time.strftime("%Y/%m/%d %H:%M:%S")
-        value_ton = f"{nano_to_amount(int(txn_val)):.9f}"
-
-        return cast(
-            List[Union[str, int, float]],
-            [
-                f"'{time_str}",
-                "STAKING",
-                "TON_WALLET",
-                "TON",
-                value_ton,
-                "",
-                "JPY",
-                0,
-                "TON",
-                f"TON_TXN_HASH: {txn_hash}",
-            ],
-        )
-    return None
+
+def _expand_row(fields: Tuple[int, str, str, str]) -> Tuple[Union[str, int], ...]:
+    _, timestamp, value_ton, txn_hash = fields
+    return (
+        timestamp,
+        *_ROW_PREFIX,
+        value_ton,
+        *_ROW_SUFFIX,
+        f"TON_TXN_HASH: {txn_hash}",
+    )
+
+
+def create_cryptact_custom_data(
+    transaction: Dict[str, Any],
+    transaction_timezone: Union[str, datetime.tzinfo] = "Asia/Tokyo",
+) -> Optional[List[Union[str, int]]]:
+    tz = (
+        _get_timezone(transaction_timezone)
+        if isinstance(transaction_timezone, str)
+        else transaction_timezone
+    )
+    fields = _extract_fields(transaction, tz)
+    # Rows stay tuples inside create_cryptact_custom_csv; the public helper keeps returning a list.
+    return list(_expand_row(fields)) if fields is not None else None
 
 
 def create_cryptact_custom_csv(
     response: List[Dict[str, Any]],
     ascending: bool = True,
     filename: str = "tonindex_v3",
+    transaction_timezone: str = "Asia/Tokyo",
+    compress: bool = False,
 ) -> None:
-    cryptact_custom_data: List[List[Union[str, int, float]]] = [
-        data
-        for transaction in response
-        if (data := create_cryptact_custom_data(transaction)) is not None
-    ]
+    # The timezone is constant for the batch, so resolve it once outside the row loop.
+    tz = _get_timezone(transaction_timezone)
+    # Rows are produced lazily and materialized only once, by sorted().
+    # Sorting on the integer Unix time is cheaper than comparing the formatted strings and
+    # stays chronological across DST fall-back, where local wall-clock times repeat.
+    rows = sorted(
+        filter(None, (_extract_fields(transaction, tz) for transaction in response)),
+        key=itemgetter(0),
+        reverse=not ascending,
+    )
 
-    if not cryptact_custom_data:
+    if not rows:
         print("No valid transactions found. CSV file not created.")
         return
 
-    df = pd.DataFrame(
-        cryptact_custom_data,
-        columns=[
-            "Timestamp",
-            "Action",
-            "Source",
-            "Base",
-            "Volume",
-            "Price",
-            "Counter",
-            "Fee",
-            "FeeCcy",
-            "Comment",
-        ],
+    prefix = f"transactions_{filename}_" if filename else "transactions_"
+    suffix = ".csv.gz" if compress else ".csv"
+    csv_file_path = (
+        ensure_output_dir(OUTPUT_DIR)
+        / f"{prefix}N={len(rows)}_{datetime.date.today()}{suffix}"
     )
 
-    df = df.sort_values("Timestamp", ascending=ascending)
-    d_today = datetime.date.today()
-    num_transactions = len(df)
-
-    output_dir = project_root / "ton_txns_data_conv" / "output"
-    output_dir.mkdir(exist_ok=True)
-
-    if filename:
-        csv_file_path = (
-            output_dir / f"transactions_{filename}_N={num_transactions}_{d_today}.csv"
-        )
-    else:
-        csv_file_path = output_dir / f"transactions_N={num_transactions}_{d_today}.csv"
-
     if csv_file_path.exists():
         overwrite = input(f"{csv_file_path} already exists. Overwrite? (y/N) ")
         if overwrite.lower() != "y":
             print("File not saved.")
             return
 
-    df.to_csv(csv_file_path, index=False)
+    f: TextIO
+    if compress:
+        f = gzip.open(
+            csv_file_path, "wt", compresslevel=6, newline="", encoding="utf-8"
+        )
+    else:
+        # A 1 MiB buffer batches the row writes into few write() syscalls on large exports.
+        f = open(csv_file_path, "w", newline="", buffering=1 << 20, encoding="utf-8")
+    with f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(CSV_HEADER)
+        writer.writerows(map(_expand_row, rows))
     print(f"CSV file saved: {csv_file_path}")
 
 
-def main() -> None:
+def main(refresh: bool = False) -> None:
     config = load_config()
     ACCOUNT_ID: str = config["ton_info"]["user_friendly_address"]
     SAVE_JSON: bool = config["file_save_option"]["save_allow_json"]
@@ -119,15 +173,33 @@ def main() -> None:
     if SAVE_CSV:
         end_time = datetime.datetime.now()
         start_time = end_time - datetime.timedelta(days=TXNS_HISTORY_PERIOD)
-        response_v3 = get_transactions_v3(
-            account=ACCOUNT_ID,
-            start_time=start_time,
-            end_time=end_time,
-            save_json=SAVE_JSON,
+        # Reuse today's saved pull for this account and period unless a refresh is requested.
+        saved_file = (
+            find_saved_transactions_file(ACCOUNT_ID, start_time, end_time)
+            if SAVE_JSON and not refresh
+            else None
         )
+        if saved_file is not None:
+            response_v3 = load_json_file(saved_file)
+            print(f"Loaded saved transactions: {saved_file}")
+        else:
+            response_v3 = get_transactions_v3(
+                account=ACCOUNT_ID,
+                start_time=start_time,
+                end_time=end_time,
+                save_json=SAVE_JSON,
+            )
         create_cryptact_custom_csv(response_v3)
         print(f"TON Index API v3: Processed {len(response_v3)} transactions")
 
 
 if __name__ == "__main__":  # pragma: no cover
-    main()
+    parser = argparse.ArgumentParser(
+        description="Create a cryptact custom CSV from TON staking reward transactions."
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch transactions from the API even if today's JSON file already exists.",
+    )
+    main(refresh=parser.parse_args().refresh)
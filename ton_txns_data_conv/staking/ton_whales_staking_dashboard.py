@@ -6,12 +6,22 @@ for TON (The Open Network) using the TON Whales staking pool.
 
 The application fetches staking data from the TON blockchain, displays it in a graph,
 and allows users to save staking reward history.
+
+Fetching the history is network-bound: each day costs two tonhubapi round trips,
+which dominate the DataFrame and CSV work. Run the script with ``--profile`` to
+print per-request timings (connection queue wait and total request time) while
+fetching, so optimization work can target the actual bottleneck.
 """
 
 import asyncio
 import csv
+import os
+import random
 import sys
+import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, cast
 
@@ -24,9 +34,19 @@ from dash.dependencies import Input, Output, State
 from pytoniq_core import Address
 from pytoniq_core.boc.address import AddressError
 
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root))
 
+from ton_txns_data_conv.utils import json_utils
+from ton_txns_data_conv.utils.http_utils import retry_after_seconds
+from ton_txns_data_conv.utils.output_dir import OUTPUT_DIR, ensure_output_dir
 
 config_values: Dict[str, Any] = {}
 
@@ -105,6 +125,141 @@ else:
     }
 
 
+# (unix timestamp, seqno, staked, pending deposit, pending withdraw, withdraw available),
+# amounts in nanoTON
+StakingRecord = Tuple[int, int, int, int, int, int]
+
+HISTORY_COLUMNS = [
+    "Timestamp",
+    "Seqno",
+    "Staked Amount",
+    "Pending Deposit",
+    "Pending Withdraw",
+    "Withdraw Available",
+]
+
+# Upper bound on in-flight requests to the tonhubapi host
+_MAX_CONCURRENT_REQUESTS = 20
+# Per-date limit so a single stalled lookup cannot hold up the whole history
+_DATE_FETCH_TIMEOUT_SECONDS = 30
+# Transient tonhubapi responses worth retrying, with capped exponential backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SECONDS = 8.0
+# Set by the --profile command line flag to print per-request aiohttp timings
+_PROFILE_REQUESTS = False
+
+# On-disk caches for block data that never changes once the block exists:
+# utime -> [seqno, block timestamp] and "seqno:pool:user" -> raw get_member values
+_SEQNO_CACHE_PATH = OUTPUT_DIR / ".seqno_cache.json"
+_STAKING_INFO_CACHE_PATH = OUTPUT_DIR / ".staking_info_cache.json"
+# Oldest entries are dropped beyond this size so the cache files stay bounded
+_MAX_CACHE_ENTRIES = 10_000
+_caches: Dict[Path, Dict[str, List[int]]] = {}
+# Dash callbacks run on server threads, each with its own event loop, and share _caches
+_cache_lock = threading.Lock()
+
+
+def _prune_cache(cache: Dict[str, List[int]]) -> None:
+    # Dicts keep insertion order, so the first keys are the oldest entries.
+    excess = len(cache) - _MAX_CACHE_ENTRIES
+    if excess > 0:
+        for key in list(cache)[:excess]:
+            del cache[key]
+
+
+def _load_cache(path: Path) -> Dict[str, List[int]]:
+    # Must be called with _cache_lock held.
+    cache = _caches.get(path)
+    if cache is None:
+        try:
+            cache = json_utils.loads(path.read_bytes())
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        _prune_cache(cache)
+        _caches[path] = cache
+    return cache
+
+
+def _get_cache(path: Path) -> Dict[str, List[int]]:
+    with _cache_lock:
+        return _load_cache(path)
+
+
+def _cache_lookup(path: Path, key: str) -> Optional[List[int]]:
+    with _cache_lock:
+        return _load_cache(path).get(key)
+
+
+def _cache_store(path: Path, key: str, value: List[int]) -> None:
+    with _cache_lock:
+        cache = _load_cache(path)
+        cache[key] = value
+        _prune_cache(cache)
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _save_caches() -> None:
+    # Snapshot under the lock so other callbacks can keep filling the caches while we write.
+    with _cache_lock:
+        snapshots = [(path, dict(cache)) for path, cache in _caches.items() if cache]
+    for path, cache in snapshots:
+        try:
+            _write_atomic(path, json_utils.dumps(cache))
+        except OSError as e:
+            print(f"Failed to save cache {path.name}: {e}")
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    # Retry-After wins when it parses to a finite delay; otherwise use jittered backoff.
+    backoff = min(0.5 * 2.0**attempt, _MAX_BACKOFF_SECONDS) + random.random()
+    return retry_after_seconds(retry_after, backoff, _MAX_BACKOFF_SECONDS)
+
+
+async def _get_json(session: aiohttp.ClientSession, url: str) -> Any:
+    """
+    GET a tonhubapi endpoint and parse the JSON body, retrying transient failures.
+
+    Args:
+        session (aiohttp.ClientSession): An active aiohttp client session.
+        url (str): The endpoint URL.
+
+    Returns:
+        Any: The parsed response body.
+
+    Note:
+        - 429 and 5xx responses are retried up to _MAX_ATTEMPTS times, honouring a
+          Retry-After header (seconds or HTTP-date, capped at _MAX_BACKOFF_SECONDS).
+          The last response is parsed as-is.
+    """
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        response = await session.get(url)
+        async with response:
+            if response.status not in _RETRY_STATUSES:
+                return json_utils.loads(await response.read())
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+        await asyncio.sleep(delay)
+
+    response = await session.get(url)
+    async with response:
+        return json_utils.loads(await response.read())
+
+
 async def get_latest_block(session: aiohttp.ClientSession) -> Tuple[int, datetime]:
     """
     Fetch the latest block information from the TON blockchain.
@@ -115,11 +270,9 @@ async def get_latest_block(session: aiohttp.ClientSession) -> Tuple[int, datetim
     Returns:
         Tuple[int, datetime]: The sequence number of the latest block and its timestamp.
     """
-    response = await session.get("https://mainnet-v4.tonhubapi.com/block/latest")
-    async with response:
-        data = await response.json()
-        seqno = data["last"]["seqno"]
-        ts_utc = datetime.fromtimestamp(data["now"], tz=timezone.utc)
+    data = await _get_json(session, "https://mainnet-v4.tonhubapi.com/block/latest")
+    seqno = data["last"]["seqno"]
+    ts_utc = datetime.fromtimestamp(data["now"], tz=timezone.utc)
     return seqno, ts_utc
 
 
@@ -137,18 +290,23 @@ async def get_block_by_unix_time(
         Tuple[Optional[int], Optional[datetime]]: The sequence number and timestamp of the block,
         or (None, None) if the block doesn't exist.
     """
-    response = await session.get(
-        f"https://mainnet-v4.tonhubapi.com/block/utime/{int(unix_time)}"
+    key = str(int(unix_time))
+    cached = _cache_lookup(_SEQNO_CACHE_PATH, key)
+    if cached is not None:
+        seqno, timestamp = cached
+        return seqno, datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    data = await _get_json(
+        session, f"https://mainnet-v4.tonhubapi.com/block/utime/{int(unix_time)}"
     )
-    async with response:
-        data = await response.json()
-        if data["exist"]:
-            shard_data = data["block"]["shards"][0]
-            seqno = shard_data["seqno"]
-            timestamp = shard_data.get("timestamp", int(unix_time))
-            return seqno, datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        else:
-            return None, None
+    if data["exist"]:
+        shard_data = data["block"]["shards"][0]
+        seqno = shard_data["seqno"]
+        timestamp = shard_data.get("timestamp", int(unix_time))
+        _cache_store(_SEQNO_CACHE_PATH, key, [seqno, timestamp])
+        return seqno, datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    else:
+        return None, None
 
 
 async def get_staking_info(
@@ -157,7 +315,7 @@ async def get_staking_info(
     timestamp: datetime,
     pool_address: str,
     get_member_user_address: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[StakingRecord]:
     """
     Fetch staking information for a specific block and pool address.
 
@@ -169,24 +327,78 @@ async def get_staking_info(
         get_member_user_address (str): The address of the user to query.
 
     Returns:
-        Optional[Dict[str, Any]]: A dictionary containing staking information,
-        or None if the information couldn't be retrieved.
+        Optional[StakingRecord]: The block timestamp as Unix seconds, the seqno and the
+        raw nanoTON amounts, or None if the information couldn't be retrieved.
     """
-    url = f"https://mainnet-v4.tonhubapi.com/block/{seqno}/{pool_address}/run/get_member/{get_member_user_address}"
-    response = await session.get(url)
-    async with response:
-        data = await response.json()
-        if "result" in data and len(data["result"]) >= 4:
-            return {
-                "Timestamp": timestamp.astimezone(config_values["TZ"]),
-                "Seqno": seqno,
-                "Staked Amount": int(data["result"][0]["value"]) / 1e9,
-                "Pending Deposit": int(data["result"][1]["value"]) / 1e9,
-                "Pending Withdraw": int(data["result"][2]["value"]) / 1e9,
-                "Withdraw Available": int(data["result"][3]["value"]) / 1e9,
-            }
-        else:
+    key = f"{seqno}:{pool_address}:{get_member_user_address}"
+    values = _cache_lookup(_STAKING_INFO_CACHE_PATH, key)
+    if values is None:
+        url = f"https://mainnet-v4.tonhubapi.com/block/{seqno}/{pool_address}/run/get_member/{get_member_user_address}"
+        data = await _get_json(session, url)
+        if "result" not in data or len(data["result"]) < 4:
             return None
+        values = [int(item["value"]) for item in data["result"][:4]]
+        _cache_store(_STAKING_INFO_CACHE_PATH, key, values)
+
+    # fetch_data converts timestamps and amounts column-wise
+    return (
+        int(timestamp.timestamp()),
+        seqno,
+        values[0],
+        values[1],
+        values[2],
+        values[3],
+    )
+
+
+def _create_profile_trace_config() -> aiohttp.TraceConfig:
+    """
+    Create an aiohttp trace config that prints timings for every request.
+
+    Returns:
+        aiohttp.TraceConfig: Trace config reporting the connection queue wait and
+        the total request time per URL.
+    """
+
+    async def on_request_start(
+        session: aiohttp.ClientSession,
+        ctx: Any,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        ctx.start = asyncio.get_running_loop().time()
+        ctx.queued = 0.0
+
+    async def on_connection_queued_start(
+        session: aiohttp.ClientSession,
+        ctx: Any,
+        params: aiohttp.TraceConnectionQueuedStartParams,
+    ) -> None:
+        ctx.queued_start = asyncio.get_running_loop().time()
+
+    async def on_connection_queued_end(
+        session: aiohttp.ClientSession,
+        ctx: Any,
+        params: aiohttp.TraceConnectionQueuedEndParams,
+    ) -> None:
+        ctx.queued += asyncio.get_running_loop().time() - ctx.queued_start
+
+    async def on_request_end(
+        session: aiohttp.ClientSession,
+        ctx: Any,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        elapsed = asyncio.get_running_loop().time() - ctx.start
+        print(
+            f"[profile] {params.response.status} queued={ctx.queued * 1000:.1f}ms "
+            f"total={elapsed * 1000:.1f}ms {params.url}"
+        )
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(on_connection_queued_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
 
 
 async def get_staking_history(
@@ -195,7 +407,7 @@ async def get_staking_history(
     hour: int,
     pool_address: str,
     get_member_user_address: str,
-) -> List[Dict[str, Any]]:
+) -> List[StakingRecord]:
     """
     Fetch staking history for a given date range.
 
@@ -207,20 +419,42 @@ async def get_staking_history(
         get_member_user_address (str): The address of the user to query.
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries containing staking information for each day in the range.
+        List[StakingRecord]: A list of staking records, one per day in the range, in HISTORY_COLUMNS order.
     """
-    async with aiohttp.ClientSession() as session:
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_bounded(
+        session: aiohttp.ClientSession, target_time: datetime
+    ) -> Optional[StakingRecord]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    get_block_and_staking_info(
+                        session, target_time, pool_address, get_member_user_address
+                    ),
+                    timeout=_DATE_FETCH_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                print(f"Timed out fetching staking info for {target_time}, skipping.")
+                return None
+
+    connector = aiohttp.TCPConnector(
+        limit=_MAX_CONCURRENT_REQUESTS,
+        limit_per_host=_MAX_CONCURRENT_REQUESTS,
+        ttl_dns_cache=300,
+    )
+    trace_configs = [_create_profile_trace_config()] if _PROFILE_REQUESTS else None
+    async with aiohttp.ClientSession(
+        connector=connector, trace_configs=trace_configs
+    ) as session:
         tasks = []
         current_date = start_date.replace(hour=hour, minute=0, second=0, microsecond=0)
         while current_date <= end_date:
-            tasks.append(
-                get_block_and_staking_info(
-                    session, current_date, pool_address, get_member_user_address
-                )
-            )
+            tasks.append(fetch_bounded(session, current_date))
             current_date += timedelta(days=1)
 
         results = await asyncio.gather(*tasks)
+        _save_caches()
         return [result for result in results if result is not None]
 
 
@@ -229,7 +463,7 @@ async def get_block_and_staking_info(
     target_time: datetime,
     pool_address: str,
     get_member_user_address: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[StakingRecord]:
     """
     Fetch block and staking information for a specific time.
 
@@ -240,7 +474,7 @@ async def get_block_and_staking_info(
         get_member_user_address (str): The address of the user to query.
 
     Returns:
-        Optional[Dict[str, Any]]: A dictionary containing staking information,
+        Optional[StakingRecord]: The staking record for the block,
         or None if the information couldn't be retrieved.
     """
     seqno, actual_time = await get_block_by_unix_time(
@@ -264,30 +498,108 @@ def calculate_staking_rewards(df: pd.DataFrame, adjust_val: float) -> pd.DataFra
     Returns:
         pd.DataFrame: A DataFrame containing calculated staking rewards.
     """
-    results = []
-    for i in range(1, len(df)):
-        current_amount = df.iloc[i]["Staked Amount"]
-        previous_amount = df.iloc[i - 1]["Staked Amount"]
-        difference = current_amount - previous_amount
-
-        if 0 < difference <= adjust_val:
-            timestamp = pd.to_datetime(df.iloc[i]["Original_Timestamp"])
-            results.append(
-                {
-                    "Timestamp": f"'{timestamp.strftime('%Y/%m/%d %H:%M:%S')}",
-                    "Action": "STAKING",
-                    "Source": "TON_WALLET",
-                    "Base": "TON",
-                    "Volume": difference,
-                    "Price": "",
-                    "Counter": config_values["DEFAULT_COUNTER_VAL"],
-                    "Fee": 0,
-                    "FeeCcy": "TON",
-                    "Comment": f"Seqno Segment:{df.iloc[i-1]['Seqno']} - {df.iloc[i]['Seqno']}",
-                }
-            )
+    staked = df["Staked Amount"].to_numpy(dtype=float)
+    delta = staked[1:] - staked[:-1]
+    mask = (delta > 0) & (delta <= adjust_val)
+    idx = mask.nonzero()[0] + 1
+    if idx.size == 0:
+        return pd.DataFrame()
+
+    timestamps = pd.to_datetime(
+        df["Original_Timestamp"].iloc[idx], utc=True
+    ).dt.tz_convert(config_values["TZ"])
+    seqno = df["Seqno"].astype(str).to_numpy()
+
+    return pd.DataFrame(
+        {
+            "Timestamp": ("'" + timestamps.dt.strftime("%Y/%m/%d %H:%M:%S")).to_numpy(),
+            "Action": "STAKING",
+            "Source": "TON_WALLET",
+            "Base": "TON",
+            "Volume": delta[mask],
+            "Price": "",
+            "Counter": config_values["DEFAULT_COUNTER_VAL"],
+            "Fee": 0,
+            "FeeCcy": "TON",
+            "Comment": "Seqno Segment:" + seqno[idx - 1] + " - " + seqno[idx],
+        }
+    )
+
+
+# The only store columns calculate_staking_rewards reads
+_REWARD_INPUT_COLUMNS = ("Original_Timestamp", "Seqno", "Staked Amount")
+
+
+@lru_cache(maxsize=8)
+def _compute_reward_history(payload: bytes, adjust_val: float) -> pd.DataFrame:
+    """
+    Calculate staking rewards, memoized on the serialized store data and threshold.
+
+    The save and overwrite-confirmation callbacks both need the same rewards, so
+    the confirmation path reuses the frame computed by the first click.
+
+    Args:
+        payload (bytes): The staking-data-store contents serialized as JSON.
+        adjust_val (float): The threshold value for considering a difference as a reward.
+
+    Returns:
+        pd.DataFrame: A DataFrame containing calculated staking rewards. The cached
+        instance is shared between calls and must not be mutated.
+    """
+    data = json_utils.loads(payload)
+    return calculate_staking_rewards(
+        pd.DataFrame({column: data[column] for column in _REWARD_INPUT_COLUMNS}),
+        adjust_val,
+    )
 
-    return pd.DataFrame(results)
+
+def _write_reward_csv(reward_df: pd.DataFrame, csv_file_path: Path) -> None:
+    with open(csv_file_path, "w", newline="", buffering=1 << 20, encoding="utf-8") as f:
+        writer = csv.writer(
+            f, quoting=csv.QUOTE_NONE, escapechar="\\", lineterminator="\n"
+        )
+        writer.writerow(reward_df.columns)
+        writer.writerows(reward_df.itertuples(index=False, name=None))
+
+
+def _save_reward_history(
+    data: Dict[str, List[Any]],
+    adjust_val: float,
+    start_date: str,
+    end_date: str,
+    overwrite: bool,
+) -> Tuple[bool, str]:
+    """
+    Calculate the staking rewards and save them to the output directory.
+
+    Args:
+        data (Dict[str, List[Any]]): Fetched staking data.
+        adjust_val (float): Adjustment value for reward calculation.
+        start_date (str): Start date of the data range.
+        end_date (str): End date of the data range.
+        overwrite (bool): Whether to replace an existing file with the same name.
+
+    Returns:
+        Tuple[bool, str]: Whether the file exists and needs overwrite confirmation,
+        and the status message.
+    """
+    reward_df = _compute_reward_history(json_utils.dumps(data), float(adjust_val))
+    if reward_df.empty:
+        return False, "No staking rewards found in the selected range."
+
+    d_today = datetime.today().date()
+    num = len(reward_df)
+
+    output_dir = ensure_output_dir(OUTPUT_DIR)
+
+    filename = f"staking_history_{start_date}_to_{end_date}_adj{adjust_val}_N{num}_{d_today}.csv"
+    csv_file_path = output_dir / filename
+
+    if not overwrite and csv_file_path.exists():
+        return True, ""
+
+    _write_reward_csv(reward_df, csv_file_path)
+    return False, f"Staking compensation history is saved in {csv_file_path}."
 
 
 # Initialize Dash app
@@ -377,6 +689,7 @@ def create_layout() -> html.Div:
     Returns:
         html.Div: The main container for the application layout.
     """
+    today = datetime.now(config_values["TZ"]).date()
     return html.Div(
         className="container",
         children=[
@@ -525,9 +838,8 @@ def create_layout() -> html.Div:
                             html.Label("Date Range:", className="label"),
                             dcc.DatePickerRange(
                                 id="date-picker-range",
-                                start_date=datetime.now(config_values["TZ"]).date()
-                                - timedelta(days=30),
-                                end_date=datetime.now(config_values["TZ"]).date(),
+                                start_date=today - timedelta(days=30),
+                                end_date=today,
                                 display_format="YYYY-MM-DD",
                                 className="date-picker",
                             ),
@@ -622,7 +934,7 @@ def fetch_data(
     start_date: str,
     end_date: str,
     hour: int,
-) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+) -> Tuple[Optional[Dict[str, List[Any]]], str]:
     """
     Fetch staking data based on user inputs.
 
@@ -635,23 +947,22 @@ def fetch_data(
         hour (int): Hour of the day to fetch data for.
 
     Returns:
-        Tuple[Optional[List[Dict[str, Any]]], str]: Fetched data and status message.
+        Tuple[Optional[Dict[str, List[Any]]], str]: Fetched data as column lists and status message.
     """
     if n_clicks is None:
         return dash.no_update, dash.no_update
 
     try:
-        start_datetime = datetime.strptime(start_date, "%Y-%m-%d").replace(
-            tzinfo=config_values["TZ"]
-        )
-        end_datetime = datetime.strptime(end_date, "%Y-%m-%d").replace(
-            tzinfo=config_values["TZ"]
-        )
+        tz = config_values["TZ"]
+        start_datetime = datetime.fromisoformat(start_date).replace(tzinfo=tz)
+        end_datetime = datetime.fromisoformat(end_date).replace(tzinfo=tz)
         hour = int(hour)
         if hour < 0 or hour > 23:
             raise ValueError("Hour must be between 0 and 23")
 
-        history = asyncio.run(
+        # uvloop's libuv-based loop dispatches the many small requests faster
+        run = uvloop.run if HAS_UVLOOP else asyncio.run
+        history = run(
             get_staking_history(
                 start_datetime,
                 end_datetime,
@@ -667,15 +978,13 @@ def fetch_data(
                 "Error: No staking history data retrieved. Please check the input parameters and try again.",
             )
 
-        df = pd.DataFrame(history)
-        # Keep original timestamp for CSV saving
-        df["Original_Timestamp"] = df["Timestamp"]
+        df = pd.DataFrame.from_records(history, columns=HISTORY_COLUMNS)
+        df[HISTORY_COLUMNS[2:]] = df[HISTORY_COLUMNS[2:]] / 1e9
+        timestamps = pd.to_datetime(df["Timestamp"], unit="s", utc=True)
+        # Keep local timestamp for CSV saving
+        df["Original_Timestamp"] = timestamps.dt.tz_convert(tz)
         # Convert to UTC for graph display
-        df["Timestamp"] = df["Timestamp"].apply(
-            lambda x: x.astimezone(timezone.utc).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-        )
+        df["Timestamp"] = timestamps.dt.floor("D")
 
         message = f"Data fetched successfully. {len(df)} records retrieved."
 
@@ -683,16 +992,15 @@ def fetch_data(
             try:
                 d_today = datetime.today().date()
                 num = len(df)
-                output_dir = project_root / "ton_txns_data_conv" / "output"
-                output_dir.mkdir(exist_ok=True)
+                output_dir = ensure_output_dir(OUTPUT_DIR)
                 csv_file_path = (
                     output_dir
                     / f"ton_whales_staking_amount_history_N={num}_{d_today}.csv"
                 )
                 # Use Original_Timestamp for CSV saving
-                df_to_save = df.copy()
-                df_to_save["Timestamp"] = df_to_save["Original_Timestamp"]
-                df_to_save = df_to_save.drop(columns=["Original_Timestamp"])
+                df_to_save = df[["Original_Timestamp", *HISTORY_COLUMNS[1:]]].rename(
+                    columns={"Original_Timestamp": "Timestamp"}
+                )
                 df_to_save.to_csv(
                     csv_file_path,
                     index=False,
@@ -704,7 +1012,7 @@ def fetch_data(
             except Exception as save_error:
                 message += f" Error saving data: {str(save_error)}"
 
-        return df.to_dict("records"), message
+        return df.to_dict("list"), message
     except Exception as e:
         return None, f"Error: {str(e)}"
 
@@ -757,58 +1065,41 @@ app.clientside_callback(
 )
 
 
-@app.callback(
-    Output("staking-graph", "figure"),
-    Input("staking-data-store", "data"),
-    Input("data-selector", "value"),
-    State("hour-input", "value"),
-)
-def update_graph(
-    data: Optional[List[Dict[str, Any]]], selected_data: str, hour: int
-) -> go.Figure:
+@lru_cache(maxsize=8)
+def _build_staking_figure(payload: bytes, selected_data: str) -> go.Figure:
     """
-    Update the staking graph based on fetched data and user selection.
+    Build the staking graph, memoized on the serialized store data and selection.
+
+    All amount columns are added as traces; those not covered by the selection are
+    hidden so the clientside selector callback can toggle them without a server trip.
 
     Args:
-        data (Optional[List[Dict[str, Any]]]): Fetched staking data.
-        selected_data (str): User-selected data type to display.
-        hour (int): Hour offset for UTC conversion.
+        payload (bytes): The staking-data-store contents serialized as JSON.
+        selected_data (str): User-selected data type to display initially.
 
     Returns:
-        go.Figure: Updated Plotly figure object.
+        go.Figure: Plotly figure object. The cached instance is shared between
+        calls and must not be mutated.
     """
-    if data is None:
-        return go.Figure()
+    df = pd.DataFrame(json_utils.loads(payload))
+    # One naive-UTC datetime64 array shared by every trace
+    timestamps = (
+        pd.to_datetime(df["Timestamp"], utc=True).dt.tz_localize(None).to_numpy()
+    )
 
-    df = pd.DataFrame(data)
-    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-
-    fig = go.Figure()
-
-    if selected_data == "all":
-        for column in [
-            "Staked Amount",
-            "Pending Deposit",
-            "Pending Withdraw",
-            "Withdraw Available",
-        ]:
-            fig.add_trace(
-                go.Scatter(
-                    x=df["Timestamp"],
-                    y=df[column],
-                    name=column,
-                    mode="lines+markers",
-                )
-            )
-    else:
-        fig.add_trace(
-            go.Scatter(
-                x=df["Timestamp"],
-                y=df["Staked Amount"],
-                name="Staked Amount",
+    fig = go.Figure(
+        data=[
+            go.Scattergl(
+                x=timestamps,
+                y=df[column].to_numpy(),
+                name=column,
                 mode="lines+markers",
+                hovertemplate="%{x|%Y-%m-%d %H:%M:%S UTC}<br>%{y:.2f}",
+                visible=selected_data == "all" or column == "Staked Amount",
             )
-        )
+            for column in HISTORY_COLUMNS[2:]
+        ]
+    )
 
     fig.update_layout(
         xaxis_title="Date (UTC)",
@@ -821,11 +1112,81 @@ def update_graph(
         hovermode="x unified",
     )
 
-    fig.update_traces(hovertemplate="%{x|%Y-%m-%d %H:%M:%S UTC}<br>%{y:.2f}")
-
     return fig
 
 
+@app.callback(
+    Output("staking-graph", "figure"),
+    Input("staking-data-store", "data"),
+    State("data-selector", "value"),
+    State("hour-input", "value"),
+)
+def update_graph(
+    data: Optional[Dict[str, List[Any]]], selected_data: str, hour: int
+) -> go.Figure:
+    """
+    Update the staking graph when new data is fetched.
+
+    Args:
+        data (Optional[Dict[str, List[Any]]]): Fetched staking data.
+        selected_data (str): User-selected data type to display initially.
+        hour (int): Hour offset for UTC conversion.
+
+    Returns:
+        go.Figure: Updated Plotly figure object.
+    """
+    if data is None:
+        return go.Figure()
+
+    return _build_staking_figure(json_utils.dumps(data), selected_data)
+
+
+app.clientside_callback(
+    """
+    function(selectedData, figure) {
+        if (!figure || !figure.data) {
+            return window.dash_clientside.no_update;
+        }
+        var data = figure.data.map(function(trace) {
+            return Object.assign({}, trace, {
+                visible: selectedData === 'all' || trace.name === 'Staked Amount'
+            });
+        });
+        return Object.assign({}, figure, {data: data});
+    }
+    """,
+    Output("staking-graph", "figure", allow_duplicate=True),
+    Input("data-selector", "value"),
+    State("staking-graph", "figure"),
+    prevent_initial_call=True,
+)
+
+
+def toggle_graph_traces(
+    selected_data: str, figure: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Show or hide the staking graph traces for the selected data type.
+
+    This clientside callback function flips the visibility of the already drawn traces
+    when the data selector changes, so switching views needs no server round trip.
+
+    Args:
+        selected_data (str): User-selected data type to display.
+                             Note: In practice, this argument is handled by the JavaScript code.
+        figure (Optional[Dict[str, Any]]): The current figure of the staking graph.
+
+    Returns:
+        Dict[str, Any]: The figure with updated trace visibility.
+                        Note: The actual return value is generated by the JavaScript code.
+
+    Note:
+        This function is a placeholder for the clientside callback.
+        The actual toggling logic is handled by the JavaScript code above.
+    """
+    return figure or {}
+
+
 @app.callback(
     Output("confirm-overwrite", "displayed"),
     Output("output-message", "children", allow_duplicate=True),
@@ -840,7 +1201,7 @@ def update_graph(
 )
 def generate_reward_history(
     n_clicks: Optional[int],
-    data: Optional[List[Dict[str, Any]]],
+    data: Optional[Dict[str, List[Any]]],
     adjust_val: float,
     start_date: str,
     end_date: str,
@@ -850,7 +1211,7 @@ def generate_reward_history(
 
     Args:
         n_clicks (Optional[int]): Number of times the button was clicked.
-        data (Optional[List[Dict[str, Any]]]): Fetched staking data.
+        data (Optional[Dict[str, List[Any]]]): Fetched staking data.
         adjust_val (float): Adjustment value for reward calculation.
         start_date (str): Start date of the data range.
         end_date (str): End date of the data range.
@@ -861,24 +1222,7 @@ def generate_reward_history(
     if n_clicks is None or data is None:
         return False, ""
 
-    df = pd.DataFrame(data)
-    reward_df = calculate_staking_rewards(df, float(adjust_val))
-    d_today = datetime.today().date()
-    num = len(reward_df)
-
-    output_dir = project_root / "ton_txns_data_conv" / "output"
-    output_dir.mkdir(exist_ok=True)
-
-    filename = f"staking_history_{start_date}_to_{end_date}_adj{adjust_val}_N{num}_{d_today}.csv"
-    csv_file_path = output_dir / filename
-
-    if csv_file_path.exists():
-        return True, ""
-
-    reward_df.to_csv(
-        csv_file_path, index=False, quoting=csv.QUOTE_NONE, escapechar="\\"
-    )
-    return False, f"Staking compensation history is saved in {csv_file_path}."
+    return _save_reward_history(data, adjust_val, start_date, end_date, overwrite=False)
 
 
 @app.callback(
@@ -894,7 +1238,7 @@ def generate_reward_history(
 )
 def handle_overwrite_confirmation(
     submit_n_clicks: Optional[int],
-    data: Optional[List[Dict[str, Any]]],
+    data: Optional[Dict[str, List[Any]]],
     adjust_val: float,
     start_date: str,
     end_date: str,
@@ -904,7 +1248,7 @@ def handle_overwrite_confirmation(
 
     Args:
         submit_n_clicks (Optional[int]): Number of times the confirmation button was clicked.
-        data (Optional[List[Dict[str, Any]]]): Fetched staking data.
+        data (Optional[Dict[str, List[Any]]]): Fetched staking data.
         adjust_val (float): Adjustment value for reward calculation.
         start_date (str): Start date of the data range.
         end_date (str): End date of the data range.
@@ -915,23 +1259,13 @@ def handle_overwrite_confirmation(
     if submit_n_clicks is None or data is None:
         return ""
 
-    df = pd.DataFrame(data)
-    reward_df = calculate_staking_rewards(df, float(adjust_val))
-    d_today = datetime.today().date()
-    num = len(reward_df)
-
-    output_dir = project_root / "ton_txns_data_conv" / "output"
-    output_dir.mkdir(exist_ok=True)
-
-    filename = f"staking_history_{start_date}_to_{end_date}_adj{adjust_val}_N{num}_{d_today}.csv"
-    csv_file_path = output_dir / filename
-
-    reward_df.to_csv(
-        csv_file_path, index=False, quoting=csv.QUOTE_NONE, escapechar="\\"
+    _, message = _save_reward_history(
+        data, adjust_val, start_date, end_date, overwrite=True
     )
-    return f"Staking compensation history is saved in {csv_file_path}."
+    return message
 
 
 if __name__ == "__main__":  # pragma: no cover
+    _PROFILE_REQUESTS = "--profile" in sys.argv[1:]
     # To allow access from other computers on the local network
     app.run(debug=True, host="0.0.0.0", port=8050)
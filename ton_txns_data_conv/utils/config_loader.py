@@ -1,7 +1,9 @@
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from tomlkit import TOMLDocument, parse
+import tomllib
 
 
 def find_config_file(file_name: str = "config.toml") -> Path:
@@ -16,12 +18,21 @@ def find_config_file(file_name: str = "config.toml") -> Path:
     )
 
 
+@lru_cache(maxsize=8)
+def _parse_config(config_file_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are part of the cache key so that edits to the file invalidate the entry.
+    with open(config_file_path, "rb") as config_file:
+        return tomllib.load(config_file)
+
+
 def load_config() -> Dict[str, Any]:
     config_file_path = find_config_file()
     try:
-        with open(config_file_path, "r") as config_file:
-            config: TOMLDocument = parse(config_file.read())
-        return dict(config)
+        stat = config_file_path.stat()
+        # Callers get their own copy so mutating one result cannot leak into the cache.
+        return copy.deepcopy(
+            _parse_config(config_file_path, stat.st_mtime_ns, stat.st_size)
+        )
     except Exception as e:
         print(f"Error: Failed to read configuration file. {str(e)}")
         raise
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def retry_after_seconds(
+    value: Optional[str], default: float, max_seconds: float
+) -> float:
+    """Converts a Retry-After header value into a bounded number of seconds to wait.
+
+    Args:
+        value (Optional[str]): The header value, either delay-seconds or an HTTP-date (RFC 9110).
+        default (float): The delay returned when the header is missing or cannot be parsed.
+        max_seconds (float): The upper bound for the returned delay.
+
+    Returns:
+        float: The delay in seconds, clamped to [0, max_seconds]. Missing, unparsable and
+        NaN values fall back to default.
+    """
+    if value is None:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if seconds != seconds:  # NaN
+        return default
+    return min(max(seconds, 0.0), max_seconds)
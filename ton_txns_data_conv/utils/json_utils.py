@@ -0,0 +1,51 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool, optional): Whether to pretty-print with an indentation of 2 spaces. Defaults to False.
+
+    Returns:
+        bytes: The serialized JSON document.
+
+    Note:
+        - orjson is used when it is installed, since it serializes several times faster than
+          the stdlib json module. Otherwise the stdlib json module is used.
+        - Compact output contains no insignificant whitespace.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        result: bytes = orjson.dumps(obj, option=option)
+        return result
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserializes a JSON document.
+
+    Args:
+        data (Union[bytes, str]): The JSON document to parse.
+
+    Returns:
+        Any: The parsed object.
+
+    Raises:
+        ValueError: If the document is not valid JSON. Both json.JSONDecodeError and
+            orjson.JSONDecodeError are subclasses of ValueError.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,22 @@
+from functools import lru_cache
+from pathlib import Path
+
+# Shared directory for the JSON/CSV files and caches written by the scripts.
+OUTPUT_DIR = Path(__file__).resolve().parents[1] / "output"
+
+
+@lru_cache(maxsize=None)
+def ensure_output_dir(output_dir: Path = OUTPUT_DIR) -> Path:
+    """Creates the output directory on first use and returns it.
+
+    Args:
+        output_dir (Path, optional): The directory to create if it does not already exist. Defaults to OUTPUT_DIR.
+
+    Returns:
+        Path: The same directory, guaranteed to exist.
+
+    Note:
+        - The result is cached per path, so the mkdir call only happens once per process.
+    """
+    output_dir.mkdir(exist_ok=True)
+    return output_dir
@@ -1,9 +1,10 @@
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 project_root = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from pytoniq_core import Address
 from pytoniq_core.boc.address import AddressError
@@ -11,6 +12,30 @@ from pytoniq_core.boc.address import AddressError
 from ton_txns_data_conv.utils.config_loader import load_config
 
 
+def _flags(bounceable: bool, url_safe: bool, test_only: bool) -> Dict[str, bool]:
+    return {
+        "is_user_friendly": True,
+        "is_bounceable": bounceable,
+        "is_url_safe": url_safe,
+        "is_test_only": test_only,
+    }
+
+
+ADDRESS_VARIANTS: Tuple[Tuple[str, Dict[str, bool]], ...] = (
+    ("User-friendly, Bounceable, URL-safe, Not test-only", _flags(True, True, False)),
+    (
+        "User-friendly, Bounceable, Not URL-safe, Not test-only",
+        _flags(True, False, False),
+    ),
+    (
+        "User-friendly, Not Bounceable, URL-safe, Not test-only",
+        _flags(False, True, False),
+    ),
+    ("User-friendly, Bounceable, URL-safe, Test-only", _flags(True, True, True)),
+    ("User-friendly, Not Bounceable, URL-safe, Test-only", _flags(False, True, True)),
+)
+
+
 def get_address_variations(address: Address) -> Dict[str, str]:
     """
     指定されたアドレスの異なるバリエーションを生成する
@@ -19,36 +44,7 @@ def get_address_variations(address: Address) -> Dict[str, str]:
     :return: アドレスの異なるバリエーションを含む辞書
     """
     return {
-        "User-friendly, Bounceable, URL-safe, Not test-only": address.to_str(
-            is_user_friendly=True,
-            is_bounceable=True,
-            is_url_safe=True,
-            is_test_only=False,
-        ),
-        "User-friendly, Bounceable, Not URL-safe, Not test-only": address.to_str(
-            is_user_friendly=True,
-            is_bounceable=True,
-            is_url_safe=False,
-            is_test_only=False,
-        ),
-        "User-friendly, Not Bounceable, URL-safe, Not test-only": address.to_str(
-            is_user_friendly=True,
-            is_bounceable=False,
-            is_url_safe=True,
-            is_test_only=False,
-        ),
-        "User-friendly, Bounceable, URL-safe, Test-only": address.to_str(
-            is_user_friendly=True,
-            is_bounceable=True,
-            is_url_safe=True,
-            is_test_only=True,
-        ),
-        "User-friendly, Not Bounceable, URL-safe, Test-only": address.to_str(
-            is_user_friendly=True,
-            is_bounceable=False,
-            is_url_safe=True,
-            is_test_only=True,
-        ),
+        description: address.to_str(**flags) for description, flags in ADDRESS_VARIANTS
     }
 
 
@@ -68,8 +64,12 @@ def main() -> None:
     try:
         address = Address(default_uf_address)
         address_variations = get_address_variations(address)
-        for description, addr in address_variations.items():
-            print(f"{description}:", addr)
+        sys.stdout.write(
+            "".join(
+                f"{description}: {addr}\n"
+                for description, addr in address_variations.items()
+            )
+        )
     except AddressError as e:
         print(f"Error: Invalid user_friendly_address. {str(e)}")
         sys.exit(1)